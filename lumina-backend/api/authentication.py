@@ -12,16 +12,113 @@ Features:
 Classes:
     JWTCookieAuthentication: Enhanced JWT authentication with cookie support
 
+Functions:
+    get_user_cache_key: Cache key of an authenticated user's row
+    invalidate_cached_user: Drop a user's cached row after it changes
+    snapshot_user / user_from_snapshot: Cacheable form of a user, minus the hash
+    revoke_access_token: Reject an access token until it expires
+
 Security Considerations:
 - httpOnly cookies prevent XSS attacks on tokens
 - Secure cookie settings prevent MITM attacks over HTTP
 - Proper token validation and error handling
 - Graceful fallback mechanisms
+- Access tokens are revoked on logout and invalidated by password changes
 """
 
 from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from django.utils import timezone
 from rest_framework_simplejwt.authentication import JWTAuthentication
-from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+from rest_framework_simplejwt.exceptions import (
+    AuthenticationFailed,
+    InvalidToken,
+    TokenError,
+)
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import datetime_from_epoch, get_md5_hash_password
+
+from .models import RevokedAccessToken
+
+# Saves and deletes evict a cached user at once; the timeout bounds how long
+# changes that skip signals, like QuerySet.update(is_active=False), go unseen
+USER_CACHE_TIMEOUT = 60
+
+# User columns kept in the cache. The password hash is left out: it is loaded
+# on access (e.g. by a password change), and tokens are checked against a
+# digest of it instead.
+USER_CACHE_FIELDS = frozenset(
+    {
+        "id",
+        "username",
+        "email",
+        "first_name",
+        "last_name",
+        "is_active",
+        "is_staff",
+        "is_superuser",
+        "last_login",
+        "date_joined",
+    }
+)
+
+
+def get_user_cache_key(user_id):
+    """Return the cache key holding the authenticated user with `user_id`."""
+    return f"auth_user:{user_id}"
+
+
+def invalidate_cached_user(user_id):
+    """Evict a user's cached row so the next request reloads it."""
+    cache.delete(get_user_cache_key(user_id))
+
+
+def snapshot_user(user):
+    """Return the cacheable parts of `user`, without the password hash."""
+    return {
+        "fields": [
+            (field.attname, getattr(user, field.attname))
+            for field in User._meta.concrete_fields
+            if field.attname in USER_CACHE_FIELDS
+        ],
+        "password_digest": get_md5_hash_password(user.password),
+    }
+
+
+def user_from_snapshot(snapshot):
+    """Rebuild a user from `snapshot`, deferring the uncached columns."""
+    field_names, values = zip(*snapshot["fields"], strict=True)
+    return User.from_db(DEFAULT_DB_ALIAS, field_names, values)
+
+
+def get_revoked_token_cache_key(jti):
+    """Return the cache key marking the access token `jti` as revoked."""
+    return f"revoked_token:{jti}"
+
+
+def revoke_access_token(token):
+    """Reject `token` on every later request until it expires.
+
+    Refresh tokens are blacklisted in the database by SimpleJWT. Access
+    tokens are recorded in RevokedAccessToken, which stays authoritative when
+    the cache is unavailable or a DummyCache, and marked in the cache, which
+    the authentication check reads together with the cached user.
+    """
+    expires_at = datetime_from_epoch(token["exp"])
+    now = timezone.now()
+    timeout = int((expires_at - now).total_seconds())
+    if timeout <= 0:
+        return
+
+    jti = token[api_settings.JTI_CLAIM]
+    # Expired tokens are rejected anyway, so their rows can go
+    RevokedAccessToken.objects.filter(expires_at__lte=now).delete()
+    RevokedAccessToken.objects.get_or_create(
+        jti=jti, defaults={"expires_at": expires_at}
+    )
+    cache.set(get_revoked_token_cache_key(jti), True, timeout)
 
 
 class JWTCookieAuthentication(JWTAuthentication):
@@ -80,6 +177,65 @@ class JWTCookieAuthentication(JWTAuthentication):
                 return header_result
             raise InvalidToken(e.args[0]) from e
 
+    def get_user(self, validated_token):
+        """Return the active user the token was issued to.
+
+        The user's columns, minus the password hash, are cached between
+        requests, so authenticated requests don't each need a SELECT on
+        auth_user. Only users that passed SimpleJWT's checks are cached, model
+        signals evict the entry whenever the user is saved or deleted, and the
+        active flag and password digest are re-checked on every cache hit. The
+        token's revocation marker is fetched in the same cache round-trip;
+        when the user isn't cached, revocation is checked in the database.
+
+        Args:
+            validated_token (Token): The validated access token
+
+        Returns:
+            User: The authenticated user
+
+        Raises:
+            AuthenticationFailed: If the token was revoked by a logout or
+                issued before the user's last password change, or the user
+                is inactive
+
+        """
+        user_key = get_user_cache_key(validated_token.get(api_settings.USER_ID_CLAIM))
+        revoked_key = get_revoked_token_cache_key(
+            validated_token.get(api_settings.JTI_CLAIM)
+        )
+        cached = cache.get_many([user_key, revoked_key])
+        if cached.get(revoked_key):
+            raise AuthenticationFailed("Token has been revoked", code="token_revoked")
+
+        snapshot = cached.get(user_key)
+        if snapshot is None:
+            # Without a cached user the cache may be down or a DummyCache, so
+            # the missing revocation marker can't be trusted
+            if RevokedAccessToken.objects.filter(
+                jti=validated_token.get(api_settings.JTI_CLAIM)
+            ).exists():
+                raise AuthenticationFailed(
+                    "Token has been revoked", code="token_revoked"
+                )
+            user = super().get_user(validated_token)
+            cache.set(user_key, snapshot_user(user), USER_CACHE_TIMEOUT)
+            return user
+
+        # SimpleJWT's own checks only run on a cache miss
+        user = user_from_snapshot(snapshot)
+        if not user.is_active:
+            raise AuthenticationFailed("User is inactive", code="user_inactive")
+        if (
+            api_settings.CHECK_REVOKE_TOKEN
+            and validated_token.get(api_settings.REVOKE_TOKEN_CLAIM)
+            != snapshot["password_digest"]
+        ):
+            raise AuthenticationFailed(
+                "The user's password has been changed.", code="password_changed"
+            )
+        return user
+
     def authenticate_header(self, _request):
         """Return the authentication header for challenge responses.
 
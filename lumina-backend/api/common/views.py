@@ -1,43 +1,46 @@
 """Common utility views."""
 
+from django.views.decorators.cache import cache_control
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 
+# Both payloads are static, so they are built once at import time
+HEALTH_PAYLOAD = {
+    "status": "healthy",
+    "message": "Lumina API is running successfully",
+    "version": "1.0.0",
+}
+
+API_INFO_PAYLOAD = {
+    "api_name": "Lumina Backend API",
+    "description": "REST API for Lumina Desktop Application",
+    "framework": "Django REST Framework",
+    "database": "PostgreSQL",
+    "cors_enabled": True,
+    "endpoints": [
+        "/api/health/",
+        "/api/info/",
+        "/api/auth/signup/",
+        "/api/auth/signin/",
+        "/api/auth/logout/",
+        "/api/auth/refresh/",
+        "/api/auth/profile/",
+        "/api/auth/change-password/",
+    ],
+}
+
 
 @api_view(["GET"])
 @permission_classes([AllowAny])
 def health_check(_request):
     """Test API connectivity with simple health check."""
-    return Response(
-        {
-            "status": "healthy",
-            "message": "Lumina API is running successfully",
-            "version": "1.0.0",
-        }
-    )
+    return Response(HEALTH_PAYLOAD)
 
 
+@cache_control(max_age=300, public=True)
 @api_view(["GET"])
 @permission_classes([AllowAny])
 def api_info(_request):
     """Provide basic API information for testing Electron-Django communication."""
-    return Response(
-        {
-            "api_name": "Lumina Backend API",
-            "description": "REST API for Lumina Desktop Application",
-            "framework": "Django REST Framework",
-            "database": "PostgreSQL",
-            "cors_enabled": True,
-            "endpoints": [
-                "/api/health/",
-                "/api/info/",
-                "/api/auth/signup/",
-                "/api/auth/signin/",
-                "/api/auth/logout/",
-                "/api/auth/refresh/",
-                "/api/auth/profile/",
-                "/api/auth/change-password/",
-            ],
-        }
-    )
+    return Response(API_INFO_PAYLOAD)
@@ -1 +1,65 @@
-# Create your models here.
+"""Models shared across the api app."""
+
+from django.db import models
+
+
+class RevokedAccessToken(models.Model):
+    """An access token rejected before it expires, e.g. after logout.
+
+    The database is the authoritative record; the cache holds a copy so
+    that most authenticated requests can check it without a query.
+    """
+
+    jti = models.CharField(max_length=255, unique=True)
+    expires_at = models.DateTimeField(db_index=True)
+
+    def __str__(self):
+        return f"Revoked access token {self.jti}"
+
+
+class FieldTrackingMixin:
+    """Remember a model instance's loaded field values to detect changes.
+
+    Values are recorded when the instance is loaded, refreshed or saved
+    (models that track changes call ``snapshot_field_values()`` once a save
+    is done). Deferred fields are skipped until they are loaded.
+    """
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Load the instance and remember its field values."""
+        instance = super().from_db(db, field_names, values)
+        instance.snapshot_field_values()
+        return instance
+
+    def refresh_from_db(self, *args, **kwargs):
+        """Reload the instance and its remembered field values."""
+        super().refresh_from_db(*args, **kwargs)
+        self.snapshot_field_values()
+
+    def snapshot_field_values(self):
+        """Record the current values of loaded concrete fields."""
+        self._loaded_field_values = {
+            field.attname: self.__dict__[field.attname]
+            for field in self._meta.concrete_fields
+            if field.attname in self.__dict__
+        }
+
+    def field_changed(self, attname):
+        """Check whether a field changed since loading; unknown counts as changed."""
+        loaded = getattr(self, "_loaded_field_values", None)
+        if loaded is None:
+            return True
+        if attname not in self.__dict__:
+            return False
+        return attname not in loaded or loaded[attname] != self.__dict__[attname]
+
+    def changed_fields(self):
+        """Return the concrete fields changed since loading, or None if unknown."""
+        if getattr(self, "_loaded_field_values", None) is None:
+            return None
+        return [
+            field
+            for field in self._meta.concrete_fields
+            if self.field_changed(field.attname)
+        ]
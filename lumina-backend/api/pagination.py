@@ -20,7 +20,7 @@ Response Format:
 
 Pagination Classes:
     - StandardResultsSetPagination: 20 items per page, max 100 (default for most views)
-    - LargeResultsSetPagination: 50 items per page, max 200 (for task lists)
+    - LargeResultsSetPagination: 50 items per page, max 200 (for large lists)
     - SmallResultsSetPagination: 10 items per page, max 50 (for comments)
 
 Query Parameters:
@@ -0,0 +1,14 @@
+"""Signal receivers for models the api app doesn't own."""
+
+from django.contrib.auth.models import User
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .authentication import invalidate_cached_user
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_cached_user_on_change(sender, instance, **kwargs):
+    """Evict the cached authenticated user when their row changes."""
+    invalidate_cached_user(instance.pk)
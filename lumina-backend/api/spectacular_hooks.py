@@ -66,6 +66,7 @@ def postprocessing_hook(result, _generator, _request, _public):
                 "labels": [{"id": 1, "name": "documentation", "color": "#10B981"}],
                 "subtask_count": 3,
                 "completed_subtask_count": 1,
+                "comment_count": 2,
                 "is_overdue": False,
             },
         }
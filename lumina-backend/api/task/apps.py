@@ -7,3 +7,15 @@ class TaskConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "api.task"
     verbose_name = "Task Management"
+
+    def ready(self):
+        """Warm the root URL resolver's reverse lookup tables.
+
+        Django builds the reverse/namespace dictionaries lazily on the first
+        ``reverse()`` call. Populating them here moves that one-off walk over
+        every included ``urlpatterns`` list to startup, so the first request
+        (or test) that reverses a URL name doesn't pay for it.
+        """
+        from django.urls import get_resolver
+
+        get_resolver().reverse_dict  # noqa: B018
@@ -0,0 +1,37 @@
+"""Per-user response caching helpers for task management endpoints.
+
+Cached responses are keyed on a per-user version counter. Writes bump the
+counter instead of deleting keys, so every cached entry in that namespace is
+invalidated at once for the user and stale entries simply expire.
+"""
+
+from django.core.cache import cache
+
+PROJECT_LIST_NAMESPACE = "project_list"
+LABEL_LIST_NAMESPACE = "label_list"
+TASK_STATS_NAMESPACE = "task_stats"
+
+
+def _version_key(namespace, user_id):
+    return f"{namespace}_version:{user_id}"
+
+
+def get_user_cache_key(namespace, user_id, *parts):
+    """Build a versioned cache key for a user's entry in `namespace`."""
+    version = cache.get(_version_key(namespace, user_id), 0)
+    return ":".join([namespace, str(user_id), f"v{version}", *map(str, parts)])
+
+
+def get_list_cache_key(namespace, request):
+    """Build the cache key for a user's list response, including query params."""
+    return get_user_cache_key(namespace, request.user.pk, request.GET.urlencode())
+
+
+def bump_user_cache_version(namespace, user_id):
+    """Invalidate all cached entries in `namespace` for a user."""
+    key = _version_key(namespace, user_id)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # Counter missing (first write or evicted) - start a new version
+        cache.set(key, 1, timeout=None)
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.6 on 2026-10-15 15:27
+
+import django.db.models.functions.comparison
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('task', '0004_task_search_gin_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(models.F('user'), django.db.models.functions.comparison.Least('date', 'due_date'), condition=models.Q(('is_completed', False)), name='task_upcoming_idx'),
+        ),
+    ]
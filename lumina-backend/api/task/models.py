@@ -3,15 +3,41 @@
 import re
 
 from django.contrib.auth.models import User
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models.functions import Least
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.utils import timezone
 from django.utils.html import strip_tags
 
+from api.models import FieldTrackingMixin
+
+from .cache import (
+    LABEL_LIST_NAMESPACE,
+    PROJECT_LIST_NAMESPACE,
+    TASK_STATS_NAMESPACE,
+    bump_user_cache_version,
+)
+
+# Earliest of a task's scheduled date and due date (Postgres LEAST ignores
+# NULLs). Shared by the upcoming-tasks index and the today/week filters.
+TASK_EARLIEST_DATE = Least("date", "due_date")
+
+# Full-text search document for tasks. Shared by the GIN expression index and
+# the task list search filter so Postgres can match the query to the index.
+TASK_SEARCH_VECTOR = SearchVector("title", "description", "notes", config="simple")
+
+# Compiled once; these run on every model clean()
+HEX_COLOR_RE = re.compile(r"^#[0-9A-Fa-f]{6}$")
+SCRIPT_TAG_RE = re.compile(r"<script[^>]*>.*?</script>", re.IGNORECASE)
+
 
 def validate_hex_color(value):
     """Validate that a color value is a valid hex color code."""
-    if not re.match(r"^#[0-9A-Fa-f]{6}$", value):
+    if not HEX_COLOR_RE.match(value):
         raise ValidationError(
             f"'{value}' is not a valid hex color code. Use format: #RRGGBB"
         )
@@ -24,7 +50,7 @@ def sanitize_text_input(text):
     # Strip HTML tags and escape remaining content
     cleaned = strip_tags(text)
     # Remove any remaining script-like content
-    cleaned = re.sub(r"<script[^>]*>.*?</script>", "", cleaned, flags=re.IGNORECASE)
+    cleaned = SCRIPT_TAG_RE.sub("", cleaned)
     return cleaned.strip()
 
 
@@ -132,7 +158,7 @@ class Label(models.Model):
         return f"{self.user.username} - {self.name}"
 
 
-class Task(models.Model):
+class Task(FieldTrackingMixin, models.Model):
     """Enhanced Task model inspired by Todoist and Notion."""
 
     PRIORITY_CHOICES = [
@@ -143,6 +169,9 @@ class Task(models.Model):
         ("", "No Priority"),
     ]
 
+    # Fields that feed cached task stats and project task counts
+    COUNTED_FIELDS = ("is_completed", "priority", "date", "due_date", "project_id")
+
     title = models.CharField(max_length=500, help_text="The task title or name")
     description = models.TextField(blank=True, help_text="Optional task description")
     notes = models.TextField(
@@ -188,6 +217,39 @@ class Task(models.Model):
 
     class Meta:
         ordering = ["position", "-created_at"]
+        indexes = [
+            # Index for the default task list (top-level tasks in list order)
+            models.Index(
+                fields=["user", "parent_task", "position", "-created_at"],
+                name="task_user_list_order_idx",
+            ),
+            # Partial index for the overdue view
+            models.Index(
+                fields=["user", "due_date"],
+                condition=models.Q(is_completed=False),
+                name="task_overdue_idx",
+            ),
+            # Partial index for priority filtering of pending tasks
+            models.Index(
+                fields=["user", "priority"],
+                condition=models.Q(is_completed=False),
+                name="task_pending_priority_idx",
+            ),
+            # Index for project task lists
+            models.Index(
+                fields=["user", "project", "position"],
+                name="task_user_project_idx",
+            ),
+            # Partial expression index for the today/week views
+            models.Index(
+                models.F("user"),
+                TASK_EARLIEST_DATE,
+                condition=models.Q(is_completed=False),
+                name="task_upcoming_idx",
+            ),
+            # GIN expression index for full-text search
+            GinIndex(TASK_SEARCH_VECTOR, name="task_search_gin_idx"),
+        ]
 
     def clean(self):
         """Validate and sanitize task data."""
@@ -222,6 +284,10 @@ class Task(models.Model):
     def __str__(self):
         return f"{self.title} ({self.user.username})"
 
+    def counted_fields_changed(self):
+        """Check whether any field feeding cached counts changed since loading."""
+        return any(self.field_changed(field) for field in self.COUNTED_FIELDS)
+
     def save(self, *args, **kwargs):
         # Validate before saving
         self.full_clean()
@@ -242,14 +308,25 @@ class Task(models.Model):
 
     @property
     def subtask_count(self):
-        """Get count of subtasks."""
+        """Get count of subtasks, using the list queryset annotation if present."""
+        if hasattr(self, "annotated_subtask_count"):
+            return self.annotated_subtask_count
         return self.subtasks.count()
 
     @property
     def completed_subtask_count(self):
-        """Get count of completed subtasks."""
+        """Get count of completed subtasks, using the annotation if present."""
+        if hasattr(self, "annotated_completed_subtask_count"):
+            return self.annotated_completed_subtask_count
         return self.subtasks.filter(is_completed=True).count()
 
+    @property
+    def comment_count(self):
+        """Get count of comments, using the list queryset annotation if present."""
+        if hasattr(self, "annotated_comment_count"):
+            return self.annotated_comment_count
+        return self.comments.count()
+
 
 class TaskComment(models.Model):
     """Comments on tasks for discussions and notes."""
@@ -285,3 +362,41 @@ class TaskComment(models.Model):
 
     def __str__(self):
         return f"Comment by {self.user.username} on {self.task.title}"
+
+
+def invalidate_user_task_caches(user_id):
+    """Invalidate every cached response derived from a user's tasks."""
+    bump_user_cache_version(PROJECT_LIST_NAMESPACE, user_id)
+    bump_user_cache_version(TASK_STATS_NAMESPACE, user_id)
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_delete, sender=Project)
+def invalidate_project_list_cache(sender, instance, **kwargs):
+    """Invalidate cached project lists when a project changes."""
+    bump_user_cache_version(PROJECT_LIST_NAMESPACE, instance.user_id)
+
+
+@receiver(post_save, sender=Task)
+def invalidate_task_caches_on_save(sender, instance, created, **kwargs):
+    """Invalidate cached task counts unless only uncounted fields changed.
+
+    Edits to a task's title, notes, position and so on are frequent and
+    don't affect task stats or project task counts, so they keep the cache.
+    """
+    if created or instance.counted_fields_changed():
+        invalidate_user_task_caches(instance.user_id)
+    instance.snapshot_field_values()
+
+
+@receiver(post_delete, sender=Task)
+def invalidate_task_caches_on_delete(sender, instance, **kwargs):
+    """Invalidate cached task stats and project lists (which show task counts)."""
+    invalidate_user_task_caches(instance.user_id)
+
+
+@receiver(post_save, sender=Label)
+@receiver(post_delete, sender=Label)
+def invalidate_label_list_cache(sender, instance, **kwargs):
+    """Invalidate cached label lists when a label changes."""
+    bump_user_cache_version(LABEL_LIST_NAMESPACE, instance.user_id)
@@ -334,6 +334,7 @@ class TaskListSerializer(serializers.ModelSerializer):
     is_overdue = serializers.ReadOnlyField()
     subtask_count = serializers.ReadOnlyField()
     completed_subtask_count = serializers.ReadOnlyField()
+    comment_count = serializers.ReadOnlyField()
 
     class Meta:
         model = Task
@@ -351,6 +352,7 @@ class TaskListSerializer(serializers.ModelSerializer):
             "is_overdue",
             "subtask_count",
             "completed_subtask_count",
+            "comment_count",
             "created_at",
             "updated_at",
         ]
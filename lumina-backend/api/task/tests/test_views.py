@@ -2,6 +2,8 @@
 
 from datetime import timedelta
 
+from django.core.cache import cache
+from django.test import override_settings
 from django.urls import reverse
 from django.utils import timezone
 from rest_framework import status
@@ -103,6 +105,62 @@ class ProjectAPITest(BaseTaskAPITest):
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
 
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class ProjectListCacheTest(BaseTaskAPITest):
+    """Test cases for per-user caching of the project list."""
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
+    def test_project_list_invalidated_on_create(self):
+        """Test that creating a project invalidates the cached list."""
+        url = reverse("task:project-list")
+        ProjectFactory(user=self.user, name="First")
+        self.client.get(url)
+
+        with self.assertNumQueries(0):
+            response = self.client.get(url)
+        self.assertEqual(len(response.data["results"]), 1)
+
+        self.client.post(url, {"name": "Second"}, format="json")
+        response = self.client.get(url)
+        self.assertEqual(len(response.data["results"]), 2)
+
+    def test_project_list_invalidated_on_task_changes(self):
+        """Test that task writes refresh cached project task counts."""
+        project = ProjectFactory(user=self.user)
+        task = TaskFactory(user=self.user, project=project)
+        url = reverse("task:project-list")
+        self.client.get(url)
+
+        self.client.patch(
+            reverse("task:task-bulk-update"),
+            {"task_ids": [task.id], "action": "complete"},
+            format="json",
+        )
+        response = self.client.get(url)
+        self.assertEqual(response.data["results"][0]["completed_task_count"], 1)
+
+        TaskFactory(user=self.user, project=project)
+        response = self.client.get(url)
+        self.assertEqual(response.data["results"][0]["task_count"], 2)
+
+    def test_project_list_cached_per_user(self):
+        """Test that cached lists are not shared between users."""
+        ProjectFactory(user=self.user, name="Mine")
+        ProjectFactory(user=self.other_user, name="Theirs")
+        url = reverse("task:project-list")
+        self.client.get(url)
+
+        self.client.force_authenticate(user=self.other_user)
+        response = self.client.get(url)
+        project_names = [p["name"] for p in response.data["results"]]
+        self.assertEqual(project_names, ["Theirs"])
+
+
 class LabelAPITest(BaseTaskAPITest):
     """Test cases for Label API endpoints."""
 
@@ -186,6 +244,68 @@ class TaskAPITest(BaseTaskAPITest):
         self.assertIn("User Task", task_titles)
         self.assertNotIn("Other Task", task_titles)
 
+    def test_list_tasks_pagination(self):
+        """Test paging through the task list by page number."""
+        tasks = TaskFactory.create_batch(5, user=self.user, position=0)
+
+        url = reverse("task:task-list")
+        response = self.client.get(url, {"page_size": 2})
+        self.assertEqual(response.data["pagination"]["count"], 5)
+        self.assertEqual(response.data["pagination"]["total_pages"], 3)
+        seen_ids = [t["id"] for t in response.data["results"]]
+        while response.data["pagination"]["next"]:
+            response = self.client.get(response.data["pagination"]["next"])
+            seen_ids += [t["id"] for t in response.data["results"]]
+
+        self.assertEqual(sorted(seen_ids), sorted(t.id for t in tasks))
+        self.assertEqual(len(seen_ids), len(set(seen_ids)))
+
+    def test_list_tasks_fast(self):
+        """Test the Postgres-encoded task list honours filters and paging."""
+        first = TaskFactory(user=self.user, position=0, priority="P1")
+        second = TaskFactory(user=self.user, position=1, priority="P1")
+        TaskFactory(user=self.user, position=2, priority="P2")
+        TaskFactory(user=self.other_user, priority="P1")
+
+        url = reverse("task:task-list")
+        with self.assertNumQueries(1):
+            response = self.client.get(url, {"fast": "1", "priority": "P1"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/json")
+        rows = response.json()
+        self.assertEqual([row["id"] for row in rows], [first.id, second.id])
+        self.assertEqual(
+            set(rows[0]),
+            {
+                "id",
+                "title",
+                "priority",
+                "due_date",
+                "date",
+                "position",
+                "is_completed",
+                "project_id",
+                "created_at",
+            },
+        )
+
+        response = self.client.get(
+            url, {"fast": "1", "priority": "P1", "page_size": 1, "page": 2}
+        )
+        self.assertEqual([row["id"] for row in response.json()], [second.id])
+
+        # Not a prefix of any word in the factories' Faker text
+        response = self.client.get(url, {"fast": "1", "search": "zzxqj"})
+        self.assertEqual(response.json(), [])
+
+    def test_list_tasks_fast_invalid_page(self):
+        """Test the fast task list rejects malformed page numbers."""
+        url = reverse("task:task-list")
+        for page in ("0", "abc"):
+            response = self.client.get(url, {"fast": "1", "page": page})
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
     def test_create_task(self):
         """Test creating a new task."""
         url = reverse("task:task-list")
@@ -302,6 +422,43 @@ class TaskAPITest(BaseTaskAPITest):
         self.assertIn(task3.id, task_ids)
         self.assertNotIn(task4.id, task_ids)
 
+    def test_search_tasks_matches_partial_words(self):
+        """Test that search terms match the start of longer words."""
+        task1 = TaskFactory(user=self.user, title="Python Development")
+        task2 = TaskFactory(user=self.user, title="Developer meetup")
+        task3 = TaskFactory(
+            user=self.user, title="Java Testing", description="", notes=""
+        )
+
+        url = reverse("task:task-list")
+        response = self.client.get(url, {"search": "develop"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        task_ids = [t["id"] for t in response.data["results"]]
+        self.assertIn(task1.id, task_ids)
+        self.assertIn(task2.id, task_ids)
+        self.assertNotIn(task3.id, task_ids)
+
+        # Every word must match, and query syntax is treated as plain text
+        response = self.client.get(url, {"search": "pyth & (devel:* | !"})
+        task_ids = [t["id"] for t in response.data["results"]]
+        self.assertEqual(task_ids, [task1.id])
+
+    def test_search_tasks_short_term_matches_substrings(self):
+        """Test that short search terms fall back to substring matching."""
+        task1 = TaskFactory(user=self.user, title="Gym session")
+        task2 = TaskFactory(
+            user=self.user, title="Java Development", description="", notes=""
+        )
+
+        url = reverse("task:task-list")
+        response = self.client.get(url, {"search": "gy"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        task_ids = [t["id"] for t in response.data["results"]]
+        self.assertIn(task1.id, task_ids)
+        self.assertNotIn(task2.id, task_ids)
+
     def test_filter_today_tasks(self):
         """Test filtering today's tasks."""
         today = timezone.now().date()
@@ -373,6 +530,27 @@ class TaskAPITest(BaseTaskAPITest):
         self.assertIn(parent_task.id, task_ids)
         self.assertIn(subtask.id, task_ids)
 
+    def test_list_tasks_related_counts(self):
+        """Test subtask and comment counts in the list come from one query."""
+        parent_task = TaskFactory(user=self.user)
+        TaskFactory(user=self.user, parent_task=parent_task, is_completed=True)
+        TaskFactory(user=self.user, parent_task=parent_task)
+        TaskCommentFactory.create_batch(2, task=parent_task, user=self.user)
+        TaskFactory.create_batch(3, user=self.user)
+
+        url = reverse("task:task-list")
+        # count, tasks, labels prefetch
+        with self.assertNumQueries(3):
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        parent_data = next(
+            t for t in response.data["results"] if t["id"] == parent_task.id
+        )
+        self.assertEqual(parent_data["subtask_count"], 2)
+        self.assertEqual(parent_data["completed_subtask_count"], 1)
+        self.assertEqual(parent_data["comment_count"], 2)
+
 
 class TaskQuickCreateTest(BaseTaskAPITest):
     """Test cases for Task Quick Create endpoint."""
@@ -470,6 +648,26 @@ class TaskBulkUpdateTest(BaseTaskAPITest):
         self.assertEqual(self.task2.position, 0)
         self.assertEqual(self.task3.position, 1)
 
+    def test_bulk_reorder_invalid_positions(self):
+        """Test bulk reorder rejects malformed positions."""
+        url = reverse("task:task-bulk-update")
+        for positions in (
+            [0],
+            {"abc": 0},
+            {str(self.task1.id): "first"},
+            {str(self.task1.id): -1},
+            {str(self.task1.id): 1.5},
+            {str(self.task1.id): True},
+        ):
+            data = {
+                "task_ids": [self.task1.id],
+                "action": "reorder",
+                "positions": positions,
+            }
+
+            response = self.client.patch(url, data, format="json")
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
     def test_bulk_update_invalid_action(self):
         """Test bulk update with invalid action."""
         url = reverse("task:task-bulk-update")
@@ -508,6 +706,8 @@ class TaskBulkUpdateTest(BaseTaskAPITest):
         # Should succeed but not affect other user's task
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
+        self.assertEqual(response.data["message"], "complete completed for 0 tasks")
+
         other_task.refresh_from_db()
         self.assertFalse(other_task.is_completed)
 
@@ -529,7 +729,9 @@ class TaskCommentAPITest(BaseTaskAPITest):
         other_comment = TaskCommentFactory(task=other_task, user=self.other_user)
 
         url = reverse("task:task-comment-list", kwargs={"task_id": self.task.id})
-        response = self.client.get(url)
+        # count and comments only - listing doesn't look up the task itself
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertIn("results", response.data)
@@ -627,6 +829,53 @@ class TaskStatsAPITest(BaseTaskAPITest):
         priority_breakdown = data["priority_breakdown"]
         self.assertEqual(priority_breakdown["P1"], 1)
         self.assertEqual(priority_breakdown["P2"], 1)
+        self.assertEqual(priority_breakdown["P3"], 0)
+        self.assertEqual(priority_breakdown["P4"], 0)
+        self.assertEqual(priority_breakdown["none"], 3)
+
+    @override_settings(
+        CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+    )
+    def test_task_stats_cache_invalidated_on_task_changes(self):
+        """Test that cached stats are refreshed when tasks change."""
+        cache.clear()
+        url = reverse("task:task-stats")
+        self.client.get(url)
+
+        with self.assertNumQueries(0):
+            response = self.client.get(url)
+        self.assertEqual(response.data["total"], 6)
+
+        TaskFactory(user=self.user)
+        response = self.client.get(url)
+        self.assertEqual(response.data["total"], 7)
+
+        self.client.patch(
+            reverse("task:task-bulk-update"),
+            {"task_ids": [self.pending_task.id], "action": "complete"},
+            format="json",
+        )
+        response = self.client.get(url)
+        self.assertEqual(response.data["completed"], 2)
+
+    @override_settings(
+        CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+    )
+    def test_task_stats_cache_kept_on_uncounted_changes(self):
+        """Test that edits to fields stats don't depend on keep the cache."""
+        cache.clear()
+        url = reverse("task:task-stats")
+        self.client.get(url)
+
+        detail_url = reverse("task:task-detail", kwargs={"pk": self.p1_task.id})
+        self.client.patch(detail_url, {"title": "Renamed"}, format="json")
+        with self.assertNumQueries(0):
+            self.client.get(url)
+
+        self.client.patch(detail_url, {"priority": "P3"}, format="json")
+        response = self.client.get(url)
+        self.assertEqual(response.data["priority_breakdown"]["P1"], 0)
+        self.assertEqual(response.data["priority_breakdown"]["P3"], 1)
 
     def test_task_stats_unauthorized(self):
         """Test that task stats require authentication."""
@@ -28,9 +28,14 @@ Bulk Operations:
     Support for completing/uncompleting multiple tasks and reordering.
 """
 
+import re
 from datetime import timedelta
 
-from django.db.models import Count, Q
+from django.contrib.postgres.search import SearchQuery
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Count, Prefetch, Q
+from django.http import HttpResponse
 from django.utils import timezone
 from drf_spectacular.utils import OpenApiExample, OpenApiParameter, extend_schema
 from rest_framework import generics, status
@@ -45,7 +50,22 @@ from api.pagination import (
     StandardResultsSetPagination,
 )
 
-from .models import Label, Project, Task, TaskComment
+from .cache import (
+    LABEL_LIST_NAMESPACE,
+    PROJECT_LIST_NAMESPACE,
+    TASK_STATS_NAMESPACE,
+    get_list_cache_key,
+    get_user_cache_key,
+)
+from .models import (
+    TASK_EARLIEST_DATE,
+    TASK_SEARCH_VECTOR,
+    Label,
+    Project,
+    Task,
+    TaskComment,
+    invalidate_user_task_caches,
+)
 from .serializers import (
     LabelSerializer,
     ProjectSerializer,
@@ -55,10 +75,136 @@ from .serializers import (
     TaskSerializer,
 )
 
+# Search terms shorter than this fall back to substring matching, since
+# full-text search only matches the start of words
+MIN_FULL_TEXT_SEARCH_LENGTH = 3
+
+# Words of a search term, matched as prefixes. Anything else, including
+# tsquery operators, only separates words.
+SEARCH_WORD_RE = re.compile(r"[^\W_]+")
+
+# Window covered by the "week" view and this_week stat
+UPCOMING_WEEK = timedelta(days=7)
+
+# Seconds cached task stats stay valid; writes invalidate them sooner
+TASK_STATS_CACHE_TIMEOUT = 300
+
+# Task list order, matching the task list composite index
+TASK_LIST_ORDERING = ("position", "-created_at")
+
+# Columns returned by the ?fast=1 task list, which Postgres encodes to JSON
+FAST_TASK_LIST_FIELDS = (
+    "id",
+    "title",
+    "priority",
+    "due_date",
+    "date",
+    "position",
+    "is_completed",
+    "project_id",
+    "created_at",
+)
+
+# Filters shared by the special list views and task_stats. Only the date
+# varies per request, so the fixed parts are built once at import.
+PENDING_TASKS = Q(is_completed=False)
+
+
+def scheduled_on(day):
+    """Match tasks whose date or due date is `day`."""
+    return Q(date=day) | Q(due_date=day)
+
+
+def scheduled_by(day):
+    """Match tasks whose date or due date is on or before `day`."""
+    return Q(date__lte=day) | Q(due_date__lte=day)
+
+
+def overdue_as_of(day):
+    """Match pending tasks whose due date is before `day`."""
+    return Q(due_date__lt=day) & PENDING_TASKS
+
+
+def search_tasks(queryset, search):
+    """Filter tasks whose title, description, or notes match `search`.
+
+    Uses the GIN-indexed full-text search document, where every word of
+    `search` matches words starting with it (so "develop" finds
+    "Development"). Terms shorter than MIN_FULL_TEXT_SEARCH_LENGTH, or with
+    no words, fall back to substring matching.
+    """
+    words = SEARCH_WORD_RE.findall(search)
+    if len(search) < MIN_FULL_TEXT_SEARCH_LENGTH or not words:
+        return queryset.filter(
+            Q(title__icontains=search)
+            | Q(description__icontains=search)
+            | Q(notes__icontains=search)
+        )
+    prefix_query = " & ".join(f"{word}:*" for word in words)
+    return queryset.annotate(search_document=TASK_SEARCH_VECTOR).filter(
+        search_document=SearchQuery(prefix_query, config="simple", search_type="raw")
+    )
+
 
-class ProjectListCreateView(generics.ListCreateAPIView):
+def render_rows_as_json(queryset):
+    """Encode the rows of a values() queryset as a JSON array in Postgres.
+
+    Returns the encoded array as text, skipping model instantiation and
+    serializer field conversion entirely. The array keeps the queryset's
+    order_by(), whose fields must all be selected by values().
+    """
+    ordering = []
+    for field in queryset.query.order_by:
+        column = field.removeprefix("-")
+        if column not in queryset.query.values_select:
+            raise ValueError(f"Ordering field {column!r} is not a selected column")
+        direction = "DESC" if field.startswith("-") else "ASC"
+        ordering.append(f"t.{connection.ops.quote_name(column)} {direction}")
+    order_clause = f" ORDER BY {', '.join(ordering)}" if ordering else ""
+
+    sql, params = queryset.query.sql_with_params()
+    with connection.cursor() as cursor:
+        # Cast to text so the driver hands back the JSON undecoded. `sql` is
+        # compiled by the ORM with values passed as parameters, and the
+        # ordering columns are quoted names checked against the selection.
+        cursor.execute(
+            f"SELECT COALESCE(json_agg(row_to_json(t){order_clause}), '[]')::text "  # noqa: S608
+            f"FROM ({sql}) t",
+            params,
+        )
+        return cursor.fetchone()[0]
+
+
+class UserListCacheMixin:
+    """Cache list responses per user for views whose data rarely changes.
+
+    Entries are keyed on a per-user version counter that model signals bump
+    on every write, so a cache hit skips the database entirely.
+
+    Attributes:
+        cache_namespace (str): Namespace of the per-user version counter
+        cache_timeout (int): Seconds a cached page stays valid
+
+    """
+
+    cache_namespace = None
+    cache_timeout = 300
+
+    def list(self, request, *args, **kwargs):
+        cache_key = get_list_cache_key(self.cache_namespace, request)
+        data = cache.get(cache_key)
+        if data is not None:
+            return Response(data)
+
+        response = super().list(request, *args, **kwargs)
+        cache.set(cache_key, response.data, self.cache_timeout)
+        return response
+
+
+class ProjectListCreateView(UserListCacheMixin, generics.ListCreateAPIView):
     """List and create projects."""
 
+    cache_namespace = PROJECT_LIST_NAMESPACE
     serializer_class = ProjectSerializer
     permission_classes = [IsAuthenticated]
     pagination_class = StandardResultsSetPagination
@@ -92,15 +238,16 @@ class ProjectDetailView(generics.RetrieveUpdateDestroyAPIView):
         instance.save()
 
 
-class LabelListCreateView(generics.ListCreateAPIView):
+class LabelListCreateView(UserListCacheMixin, generics.ListCreateAPIView):
     """List and create labels."""
 
+    cache_namespace = LABEL_LIST_NAMESPACE
     serializer_class = LabelSerializer
     permission_classes = [IsAuthenticated]
     pagination_class = StandardResultsSetPagination
 
     def get_queryset(self):
-        return Label.objects.select_related("user").filter(user=self.request.user)
+        return Label.objects.filter(user=self.request.user)
 
 
 class LabelDetailView(generics.RetrieveUpdateDestroyAPIView):
@@ -110,7 +257,7 @@ class LabelDetailView(generics.RetrieveUpdateDestroyAPIView):
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
-        return Label.objects.select_related("user").filter(user=self.request.user)
+        return Label.objects.filter(user=self.request.user)
 
 
 @extend_schema(
@@ -153,6 +300,16 @@ class LabelDetailView(generics.RetrieveUpdateDestroyAPIView):
             enum=["include"],
             required=False,
         ),
+        OpenApiParameter(
+            name="fast",
+            description=(
+                "Return a flat JSON array of task columns encoded by the "
+                "database, paged with page and page_size but without the "
+                "pagination envelope"
+            ),
+            enum=["1"],
+            required=False,
+        ),
     ],
     examples=[
         OpenApiExample(
@@ -180,13 +337,65 @@ class TaskListCreateView(generics.ListCreateAPIView):
             return TaskSerializer
         return TaskListSerializer
 
+    def list(self, request, *args, **kwargs):
+        if request.query_params.get("fast") == "1":
+            return self.fast_list(request)
+        return super().list(request, *args, **kwargs)
+
+    def fast_list(self, request):
+        """List task columns as a JSON array encoded by Postgres.
+
+        Supports the same filters and `page`/`page_size` paging as the
+        regular list, without the pagination envelope or total count.
+        Nested project, labels, and related counts are not included.
+        """
+        try:
+            page = int(request.query_params.get(self.paginator.page_query_param, 1))
+        except ValueError:
+            page = 0
+        if page < 1:
+            return Response(
+                {"error": "page must be a positive integer"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        page_size = self.paginator.get_page_size(request)
+        offset = (page - 1) * page_size
+        queryset = (
+            self.filter_tasks(Task.objects.filter(user=request.user))
+            .order_by(*TASK_LIST_ORDERING)
+            .values(*FAST_TASK_LIST_FIELDS)[offset : offset + page_size]
+        )
+        return HttpResponse(
+            render_rows_as_json(queryset), content_type="application/json"
+        )
+
     def get_queryset(self):
+        # Only load the label columns rendered by LabelSerializer
+        labels_queryset = Label.objects.only("id", "name", "color", "created_at")
         queryset = (
-            Task.objects.select_related("user", "project", "parent_task")
-            .prefetch_related("labels")
+            Task.objects.select_related("project")
+            .prefetch_related(Prefetch("labels", queryset=labels_queryset))
+            # Large text fields aren't rendered by TaskListSerializer
+            .defer("description", "notes")
             .filter(user=self.request.user)
+            # Count subtasks in the list query rather than two COUNT queries
+            # per task when the serializer reads the subtask count properties
+            .annotate(
+                annotated_subtask_count=Count("subtasks", distinct=True),
+                annotated_completed_subtask_count=Count(
+                    "subtasks",
+                    filter=Q(subtasks__is_completed=True),
+                    distinct=True,
+                ),
+                # Lets clients skip fetching comments for tasks without any
+                annotated_comment_count=Count("comments", distinct=True),
+            )
         )
+        return self.filter_tasks(queryset).order_by(*TASK_LIST_ORDERING)
 
+    def filter_tasks(self, queryset):
+        """Apply the list's query parameter filters to `queryset`."""
         # Filter parameters
         project_id = self.request.query_params.get("project")
         priority = self.request.query_params.get("priority")
@@ -215,27 +424,32 @@ class TaskListCreateView(generics.ListCreateAPIView):
             queryset = queryset.filter(parent_task__isnull=True)
 
         if search:
-            queryset = queryset.filter(
-                Q(title__icontains=search)
-                | Q(description__icontains=search)
-                | Q(notes__icontains=search)
-            )
+            queryset = search_tasks(queryset, search)
 
         # Special views
+        if view:
+            queryset = self.filter_special_view(queryset, view)
+
+        return queryset
+
+    def filter_special_view(self, queryset, view):
+        """Filter pending tasks for the today, week, or overdue views."""
         today = timezone.now().date()
+        if view in ("today", "week"):
+            # "date or due date on/before X" is "earliest date on/before X",
+            # which a single range scan on task_upcoming_idx can answer
+            queryset = queryset.alias(earliest_date=TASK_EARLIEST_DATE)
         if view == "today":
-            queryset = queryset.filter(Q(date=today) | Q(due_date=today)).filter(
-                is_completed=False
+            # earliest_date__lte is implied by the OR; it lets the index be used
+            return queryset.filter(
+                scheduled_on(today) & PENDING_TASKS, earliest_date__lte=today
             )
-        elif view == "week":
-            week_end = today + timedelta(days=7)
-            queryset = queryset.filter(
-                Q(date__lte=week_end) | Q(due_date__lte=week_end)
-            ).filter(is_completed=False)
-        elif view == "overdue":
-            queryset = queryset.filter(due_date__lt=today, is_completed=False)
-
-        return queryset.order_by("position", "-created_at")
+        if view == "week":
+            week_end = today + UPCOMING_WEEK
+            return queryset.filter(PENDING_TASKS, earliest_date__lte=week_end)
+        if view == "overdue":
+            return queryset.filter(overdue_as_of(today))
+        return queryset
 
 
 class TaskDetailView(generics.RetrieveUpdateDestroyAPIView):
@@ -297,21 +511,48 @@ class TaskBulkUpdateView(APIView):
         queryset = Task.objects.filter(user=request.user, id__in=task_ids)
 
         if action == "complete":
-            queryset.update(is_completed=True, completed_at=timezone.now())
+            updated_count = queryset.update(
+                is_completed=True, completed_at=timezone.now()
+            )
+            # update() doesn't send post_save, so invalidate caches explicitly
+            invalidate_user_task_caches(request.user.pk)
         elif action == "uncomplete":
-            queryset.update(is_completed=False, completed_at=None)
+            updated_count = queryset.update(is_completed=False, completed_at=None)
+            invalidate_user_task_caches(request.user.pk)
         elif action == "reorder":
-            positions = request.data.get("positions", {})
-            for task in queryset:
-                if str(task.id) in positions:
-                    task.position = positions[str(task.id)]
-                    task.save()
+            raw_positions = request.data.get("positions", {})
+            try:
+                # Normalise to int keys once so the loop can match on task.id
+                positions = {int(k): v for k, v in raw_positions.items()}
+            except (AttributeError, TypeError, ValueError):
+                positions = None
+            # Positions must be non-negative JSON integers; int() would
+            # silently truncate floats such as 1.5
+            if positions is None or any(
+                isinstance(v, bool) or not isinstance(v, int) or v < 0
+                for v in positions.values()
+            ):
+                return Response(
+                    {"error": "positions must be an object of task_id: position"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            # Assign positions in memory and write them back in a single
+            # UPDATE instead of one save() round-trip per task
+            now = timezone.now()
+            tasks = list(queryset.only("id", "position", "updated_at"))
+            for task in tasks:
+                if task.id in positions:
+                    task.position = positions[task.id]
+                    task.updated_at = now
+            Task.objects.bulk_update(tasks, ["position", "updated_at"])
+            updated_count = len(tasks)
         else:
             return Response(
                 {"error": "Invalid action"}, status=status.HTTP_400_BAD_REQUEST
             )
 
-        return Response({"message": f"{action} completed for {queryset.count()} tasks"})
+        return Response({"message": f"{action} completed for {updated_count} tasks"})
 
 
 class TaskCommentListCreateView(generics.ListCreateAPIView):
@@ -323,8 +564,19 @@ class TaskCommentListCreateView(generics.ListCreateAPIView):
 
     def get_queryset(self):
         task_id = self.kwargs["task_id"]
-        return TaskComment.objects.select_related("user", "task").filter(
-            task__id=task_id, task__user=self.request.user
+        return (
+            TaskComment.objects.select_related("user")
+            .only(
+                "id",
+                "content",
+                "created_at",
+                "updated_at",
+                "user__id",
+                "user__username",
+                "user__first_name",
+                "user__last_name",
+            )
+            .filter(task__id=task_id, task__user=self.request.user)
         )
 
     def get_serializer_context(self):
@@ -332,15 +584,22 @@ class TaskCommentListCreateView(generics.ListCreateAPIView):
 
         This allows the serializer to automatically associate new comments
         with the correct task while ensuring the user has access to that task.
+        The task is only looked up for POST requests, since listing comments
+        doesn't need it.
 
         Returns:
             dict: Enhanced context with task instance if accessible
 
         """
         context = super().get_serializer_context()
+        if self.request.method != "POST":
+            return context
+
         task_id = self.kwargs["task_id"]
         try:
-            task = Task.objects.get(id=task_id, user=self.request.user)
+            task = Task.objects.only("id", "user_id").get(
+                id=task_id, user=self.request.user
+            )
             context["task"] = task
         except Task.DoesNotExist:
             # Task not found or user doesn't have access - context remains unchanged
@@ -355,7 +614,7 @@ class TaskCommentDetailView(generics.RetrieveUpdateDestroyAPIView):
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
-        return TaskComment.objects.select_related("user", "task").filter(
+        return TaskComment.objects.select_related("user").filter(
             task__user=self.request.user, user=self.request.user
         )
 
@@ -383,9 +642,18 @@ class TaskCommentDetailView(generics.RetrieveUpdateDestroyAPIView):
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
 def task_stats(request):
-    """Get task statistics for the authenticated user."""
+    """Get task statistics for the authenticated user.
+
+    Stats are cached per user until one of their tasks changes. The date is
+    part of the key so date-relative counts roll over at midnight.
+    """
     today = timezone.now().date()
-    week_end = today + timedelta(days=7)
+    cache_key = get_user_cache_key(TASK_STATS_NAMESPACE, request.user.pk, today)
+    stats = cache.get(cache_key)
+    if stats is not None:
+        return Response(stats)
+
+    week_end = today + UPCOMING_WEEK
 
     # Get optimized aggregated stats in a single query
     base_queryset = Task.objects.filter(user=request.user)
@@ -394,23 +662,19 @@ def task_stats(request):
     stats_aggregate = base_queryset.aggregate(
         total=Count("id"),
         completed=Count("id", filter=Q(is_completed=True)),
-        pending=Count("id", filter=Q(is_completed=False)),
-        overdue=Count("id", filter=Q(due_date__lt=today, is_completed=False)),
-        today=Count(
-            "id", filter=Q((Q(date=today) | Q(due_date=today)) & Q(is_completed=False))
-        ),
-        this_week=Count(
-            "id",
-            filter=Q(
-                (Q(date__lte=week_end) | Q(due_date__lte=week_end))
-                & Q(is_completed=False)
-            ),
-        ),
-        p1_count=Count("id", filter=Q(priority="P1", is_completed=False)),
-        p2_count=Count("id", filter=Q(priority="P2", is_completed=False)),
-        p3_count=Count("id", filter=Q(priority="P3", is_completed=False)),
-        p4_count=Count("id", filter=Q(priority="P4", is_completed=False)),
-        none_count=Count("id", filter=Q(priority="", is_completed=False)),
+        pending=Count("id", filter=PENDING_TASKS),
+        overdue=Count("id", filter=overdue_as_of(today)),
+        today=Count("id", filter=scheduled_on(today) & PENDING_TASKS),
+        this_week=Count("id", filter=scheduled_by(week_end) & PENDING_TASKS),
+    )
+
+    # Pending tasks per priority in one GROUP BY scan instead of one
+    # conditional aggregate per priority level
+    priority_counts = dict(
+        base_queryset.filter(PENDING_TASKS)
+        .order_by()
+        .values_list("priority")
+        .annotate(count=Count("id"))
     )
 
     # Format response
@@ -422,12 +686,13 @@ def task_stats(request):
         "today": stats_aggregate["today"],
         "this_week": stats_aggregate["this_week"],
         "priority_breakdown": {
-            "P1": stats_aggregate["p1_count"],
-            "P2": stats_aggregate["p2_count"],
-            "P3": stats_aggregate["p3_count"],
-            "P4": stats_aggregate["p4_count"],
-            "none": stats_aggregate["none_count"],
+            "P1": priority_counts.get("P1", 0),
+            "P2": priority_counts.get("P2", 0),
+            "P3": priority_counts.get("P3", 0),
+            "P4": priority_counts.get("P4", 0),
+            "none": priority_counts.get("", 0),
         },
     }
+    cache.set(cache_key, stats, TASK_STATS_CACHE_TIMEOUT)
 
     return Response(stats)
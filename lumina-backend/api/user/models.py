@@ -36,10 +36,3 @@ def create_user_profile(sender, instance, created, **kwargs):
     """Automatically create a profile when a new user is created"""
     if created:
         UserProfile.objects.create(user=instance)
-
-
-@receiver(post_save, sender=User)
-def save_user_profile(sender, instance, **kwargs):
-    """Save the profile when the user is saved"""
-    if hasattr(instance, "profile"):
-        instance.profile.save()
@@ -1,7 +1,5 @@
 """User authentication and profile serializers."""
 
-import re
-
 from django.contrib.auth import authenticate
 from django.contrib.auth.models import User
 from django.contrib.auth.password_validation import validate_password
@@ -9,6 +7,84 @@ from django.core.exceptions import ValidationError as DjangoValidationError
 from rest_framework import serializers
 from rest_framework_simplejwt.tokens import RefreshToken
 
+# Symbols accepted as special characters: listed as shown in error messages,
+# and as a set for the per-character lookup
+_SPECIAL_CHARACTERS_DISPLAY = '!@#$%^&*(),.?":{}|<>'
+_SPECIAL_CHARACTER_SET = frozenset(_SPECIAL_CHARACTERS_DISPLAY)
+
+# Errors for a missing uppercase letter, lowercase letter, digit, and symbol
+_COMPLEXITY_ERRORS = (
+    "Password must contain at least one uppercase letter.",
+    "Password must contain at least one lowercase letter.",
+    "Password must contain at least one number.",
+    f"Password must contain at least one special character ({_SPECIAL_CHARACTERS_DISPLAY}).",
+)
+
+# Formats date_joined exactly as UserProfileSerializer's generated field would
+_DATE_JOINED_FIELD = serializers.DateTimeField(read_only=True)
+
+
+def validate_password_complexity(value):
+    """Check that `value` mixes upper/lowercase letters, digits and symbols.
+
+    The character classes are checked in a single pass over the password,
+    stopping as soon as all of them have been seen, and every missing class
+    is reported at once.
+
+    Raises:
+        serializers.ValidationError: If any character class is missing
+
+    """
+    has_upper = has_lower = has_digit = has_special = False
+    for ch in value:
+        if "A" <= ch <= "Z":
+            has_upper = True
+        elif "a" <= ch <= "z":
+            has_lower = True
+        elif ch.isdecimal():
+            has_digit = True
+        elif ch in _SPECIAL_CHARACTER_SET:
+            has_special = True
+        else:
+            continue
+        if has_upper and has_lower and has_digit and has_special:
+            return
+
+    seen = (has_upper, has_lower, has_digit, has_special)
+    raise serializers.ValidationError(
+        [
+            message
+            for ok, message in zip(seen, _COMPLEXITY_ERRORS, strict=True)
+            if not ok
+        ]
+    )
+
+
+def validate_password_strength(value, user=None):
+    """Run Django's password validators and the complexity requirements.
+
+    Shared by registration and password change. The minimum length is
+    enforced by the serializer fields and MinimumLengthValidator.
+
+    Args:
+        value (str): The candidate password
+        user (User): The user the password is for, if known
+
+    Returns:
+        str: The validated password
+
+    Raises:
+        serializers.ValidationError: If the password is too weak
+
+    """
+    try:
+        validate_password(value, user=user)
+    except DjangoValidationError as e:
+        raise serializers.ValidationError(list(e.messages)) from e
+
+    validate_password_complexity(value)
+    return value
+
 
 class UserRegistrationSerializer(serializers.ModelSerializer):
     """Serializer for user registration."""
@@ -29,39 +105,7 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
 
     def validate_password(self, value):
         """Validate password complexity and strength."""
-        # Use Django's built-in password validators
-        try:
-            validate_password(value)
-        except DjangoValidationError as e:
-            raise serializers.ValidationError(list(e.messages))
-
-        # Additional custom complexity requirements
-        if len(value) < 8:
-            raise serializers.ValidationError(
-                "Password must be at least 8 characters long."
-            )
-
-        if not re.search(r"[A-Z]", value):
-            raise serializers.ValidationError(
-                "Password must contain at least one uppercase letter."
-            )
-
-        if not re.search(r"[a-z]", value):
-            raise serializers.ValidationError(
-                "Password must contain at least one lowercase letter."
-            )
-
-        if not re.search(r"\d", value):
-            raise serializers.ValidationError(
-                "Password must contain at least one number."
-            )
-
-        if not re.search(r"[!@#$%^&*(),.?\":{}|<>]", value):
-            raise serializers.ValidationError(
-                'Password must contain at least one special character (!@#$%^&*(),.?":{}|<>).'
-            )
-
-        return value
+        return validate_password_strength(value)
 
     def validate(self, attrs):
         """Validate password confirmation and user data."""
@@ -81,32 +125,32 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
 class UserLoginSerializer(serializers.Serializer):
     """Serializer for user login."""
 
+    # Missing and blank values are both reported as "required"
     username = serializers.CharField(
-        error_messages={"required": "Username is required"}
+        required=True,
+        error_messages={
+            "required": "Username is required",
+            "blank": "Username is required",
+        },
     )
     password = serializers.CharField(
-        write_only=True, error_messages={"required": "Password is required"}
+        required=True,
+        write_only=True,
+        error_messages={
+            "required": "Password is required",
+            "blank": "Password is required",
+        },
     )
 
     def validate(self, attrs):
-        username = attrs.get("username")
-        password = attrs.get("password")
-
-        if not username:
-            raise serializers.ValidationError("Username is required")
-        if not password:
-            raise serializers.ValidationError("Password is required")
-
-        user = authenticate(username=username, password=password)
+        # ModelBackend hashes the password even for unknown usernames and
+        # rejects inactive users after checking it, so every failure takes
+        # the same time and gets the same message.
+        user = authenticate(username=attrs["username"], password=attrs["password"])
         if not user:
             # Generic error message to prevent username enumeration
             raise serializers.ValidationError("Invalid credentials")
 
-        if not user.is_active:
-            raise serializers.ValidationError(
-                "Your account has been deactivated. Please contact support."
-            )
-
         attrs["user"] = user
         return attrs
 
@@ -119,6 +163,21 @@ class UserProfileSerializer(serializers.ModelSerializer):
         fields = ("id", "username", "email", "first_name", "last_name", "date_joined")
         read_only_fields = ("id", "username", "date_joined")
 
+    def to_representation(self, instance):
+        """Build the profile dict directly.
+
+        Profiles are rendered on every auth response, so this skips the
+        per-field dispatch of ModelSerializer for these plain columns.
+        """
+        return {
+            "id": instance.pk,
+            "username": instance.username,
+            "email": instance.email,
+            "first_name": instance.first_name,
+            "last_name": instance.last_name,
+            "date_joined": _DATE_JOINED_FIELD.to_representation(instance.date_joined),
+        }
+
 
 class PasswordChangeSerializer(serializers.Serializer):
     """Serializer for password change."""
@@ -135,34 +194,7 @@ class PasswordChangeSerializer(serializers.Serializer):
 
     def validate_new_password(self, value):
         """Validate new password complexity and strength."""
-        # Use Django's built-in password validators
-        try:
-            validate_password(value, user=self.context["request"].user)
-        except DjangoValidationError as e:
-            raise serializers.ValidationError(list(e.messages))
-
-        # Additional custom complexity requirements
-        if not re.search(r"[A-Z]", value):
-            raise serializers.ValidationError(
-                "Password must contain at least one uppercase letter."
-            )
-
-        if not re.search(r"[a-z]", value):
-            raise serializers.ValidationError(
-                "Password must contain at least one lowercase letter."
-            )
-
-        if not re.search(r"\d", value):
-            raise serializers.ValidationError(
-                "Password must contain at least one number."
-            )
-
-        if not re.search(r"[!@#$%^&*(),.?\":{}|<>]", value):
-            raise serializers.ValidationError(
-                'Password must contain at least one special character (!@#$%^&*(),.?":{}|<>).'
-            )
-
-        return value
+        return validate_password_strength(value, user=self.context["request"].user)
 
     def validate(self, attrs):
         """Validate password confirmation."""
@@ -175,7 +207,8 @@ class PasswordChangeSerializer(serializers.Serializer):
     def save(self):
         user = self.context["request"].user
         user.set_password(self.validated_data["new_password"])
-        user.save()
+        # Only the password changed; post_save still evicts the cached user
+        user.save(update_fields=["password"])
         return user
 
 
@@ -15,21 +15,13 @@ class UserFactory(factory.django.DjangoModelFactory):
 
     username = factory.Sequence(lambda n: f"testuser{n}")
     email = factory.LazyAttribute(lambda obj: f"{obj.username}@example.com")
-    first_name = factory.Faker("first_name")
-    last_name = factory.Faker("last_name")
+    first_name = factory.Sequence(lambda n: f"First{n}")
+    last_name = factory.Sequence(lambda n: f"Last{n}")
     is_active = True
     is_staff = False
     is_superuser = False
-
-    @factory.post_generation
-    def set_password(self, create, extracted, **kwargs):
-        """Set password after user creation."""
-        if not create:
-            return
-
-        password = extracted if extracted else "TestPass123!"
-        self.set_password(password)
-        self.save()
+    # Hashed before the INSERT, so creating a user is a single query
+    password = factory.django.Password("TestPass123!")
 
 
 class SuperUserFactory(UserFactory):
@@ -1,9 +1,14 @@
 """Integration tests for user authentication flows."""
 
 import pytest
+from django.conf import settings
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIClient
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from api.user.serializers import TokenSerializer
 
 
 @pytest.mark.integration
@@ -17,7 +22,7 @@ class TestCompleteAuthenticationFlow:
         signup_data = {
             "username": "integrationuser",
             "email": "integration@example.com",
-            "password": "TestPass123!",  # Updated to meet complexity requirements
+            "password": "TestPass123!",
             "password_confirm": "TestPass123!",
             "first_name": "Integration",
             "last_name": "Test",
@@ -54,10 +59,7 @@ class TestCompleteAuthenticationFlow:
     def test_signin_refresh_token_flow(self, api_client, user):
         """Test signin -> token refresh flow."""
         # Step 1: Sign in
-        signin_data = {
-            "username": user.username,
-            "password": "TestPass123!",
-        }  # Updated password
+        signin_data = {"username": user.username, "password": "TestPass123!"}
         signin_url = reverse("user-signin")
         signin_response = api_client.post(signin_url, signin_data, format="json")
 
@@ -84,25 +86,16 @@ class TestCompleteAuthenticationFlow:
         assert profile_response.status_code == status.HTTP_200_OK
 
     @pytest.mark.django_db
-    def test_password_change_invalidates_tokens(self, api_client, user):
-        """Test that changing password still allows access (JWT tokens don't auto-invalidate)."""
-        # Step 1: Sign in
-        signin_data = {
-            "username": user.username,
-            "password": "TestPass123!",
-        }  # Updated password
-        signin_url = reverse("user-signin")
-        signin_response = api_client.post(signin_url, signin_data, format="json")
-
-        assert signin_response.status_code == status.HTTP_200_OK
-        assert "jwt_access_token" in signin_response.cookies
+    def test_password_change_invalidates_tokens(self, signed_in_client, tokens):
+        """Test that changing password invalidates previously issued tokens."""
+        api_client = signed_in_client
 
-        # Step 2: Verify access token works
+        # Step 1: Verify access token works
         profile_url = reverse("user-profile")
         profile_response = api_client.get(profile_url)
         assert profile_response.status_code == status.HTTP_200_OK
 
-        # Step 3: Change password
+        # Step 2: Change password
         password_change_url = reverse("user-change-password")
         password_change_data = {
             "current_password": "TestPass123!",
@@ -113,34 +106,29 @@ class TestCompleteAuthenticationFlow:
             password_change_url, password_change_data, format="json"
         )
         assert password_change_response.status_code == status.HTTP_200_OK
+        assert "jwt_access_token" in password_change_response.cookies
 
-        # Step 4: Verify token is still valid (JWT tokens don't auto-invalidate on password change)
-        # In production, you might want to add token blacklisting for enhanced security
+        # Step 3: This session continues with the newly issued tokens
         profile_response_after_change = api_client.get(profile_url)
         assert profile_response_after_change.status_code == status.HTTP_200_OK
 
+        # Step 4: Tokens issued before the change are rejected
+        other_client = APIClient()
+        other_client.credentials(HTTP_AUTHORIZATION=f"Bearer {tokens['access']}")
+        old_token_response = other_client.get(profile_url)
+        assert old_token_response.status_code == status.HTTP_401_UNAUTHORIZED
+
     @pytest.mark.django_db
-    def test_profile_update_flow(self, api_client, user):
+    def test_profile_update_flow(self, signed_in_client):
         """Test profile update flow with authentication."""
-        # Step 1: Sign in
-        signin_data = {
-            "username": user.username,
-            "password": "TestPass123!",
-        }  # Updated password
-        signin_url = reverse("user-signin")
-        signin_response = api_client.post(signin_url, signin_data, format="json")
-
-        assert signin_response.status_code == status.HTTP_200_OK
-        assert "jwt_access_token" in signin_response.cookies
-
-        # Step 2: Update profile (cookies automatically sent)
+        # Update profile (cookies automatically sent)
         profile_url = reverse("user-profile")
         update_data = {
             "first_name": "Updated",
             "last_name": "Name",
             "email": "updated@example.com",
         }
-        update_response = api_client.put(profile_url, update_data, format="json")
+        update_response = signed_in_client.put(profile_url, update_data, format="json")
 
         assert update_response.status_code == status.HTTP_200_OK
         assert update_response.data["first_name"] == "Updated"
@@ -150,25 +138,16 @@ class TestCompleteAuthenticationFlow:
     @pytest.mark.django_db
     def test_multiple_device_logout_simulation(self, api_client, user):
         """Test logout clears cookies for the current session only."""
-        # Create two API clients to simulate two devices
-        client1 = APIClient()
+        # Use two API clients to simulate two devices, each holding the
+        # cookies of its own signin
+        client1 = api_client
         client2 = APIClient()
-
-        # Device 1: Sign in
-        signin_data = {
-            "username": user.username,
-            "password": "TestPass123!",
-        }  # Updated password
-        signin_url = reverse("user-signin")
-        signin_response1 = client1.post(signin_url, signin_data, format="json")
-
-        assert signin_response1.status_code == status.HTTP_200_OK
-        assert "jwt_access_token" in signin_response1.cookies
-
-        # Device 2: Sign in (should create different session)
-        signin_response2 = client2.post(signin_url, signin_data, format="json")
-        assert signin_response2.status_code == status.HTTP_200_OK
-        assert "jwt_access_token" in signin_response2.cookies
+        for client in (client1, client2):
+            device_tokens = TokenSerializer.get_tokens_for_user(user)
+            client.cookies[settings.JWT_COOKIE_NAME] = device_tokens["access_token"]
+            client.cookies[settings.JWT_REFRESH_COOKIE_NAME] = device_tokens[
+                "refresh_token"
+            ]
 
         # Both devices should be able to access profile
         profile_url = reverse("user-profile")
@@ -201,20 +180,10 @@ class TestSecurityFeatures:
     """Test security-related features and edge cases."""
 
     @pytest.mark.django_db
-    def test_token_rotation_on_refresh(self, api_client, user):
+    def test_token_rotation_on_refresh(self, signed_in_client, tokens):
         """Test that refresh token rotation works correctly with cookies."""
-        # Sign in to get initial tokens
-        signin_data = {
-            "username": user.username,
-            "password": "TestPass123!",
-        }  # Updated password
-        signin_url = reverse("user-signin")
-        signin_response = api_client.post(signin_url, signin_data, format="json")
-
-        assert signin_response.status_code == status.HTTP_200_OK
-        assert "jwt_access_token" in signin_response.cookies
-        assert "jwt_refresh_token" in signin_response.cookies
-        original_access_token = signin_response.cookies["jwt_access_token"].value
+        api_client = signed_in_client
+        original_access_token = tokens["access"]
 
         # Refresh tokens (no request body needed)
         refresh_url = reverse("token-refresh")
@@ -227,24 +196,31 @@ class TestSecurityFeatures:
         new_access_token = refresh_response.cookies["jwt_access_token"].value
         assert new_access_token != original_access_token
 
+        # The refresh token is rotated and the old one can't be reused
+        new_refresh_token = refresh_response.cookies["jwt_refresh_token"].value
+        assert new_refresh_token != tokens["refresh"]
+        other_client = APIClient()
+        other_client.cookies[settings.JWT_REFRESH_COOKIE_NAME] = tokens["refresh"]
+        reuse_response = other_client.post(refresh_url, format="json")
+        assert reuse_response.status_code == status.HTTP_401_UNAUTHORIZED
+
         # Use the new access token (automatically sent via cookies)
         profile_url = reverse("user-profile")
         profile_response = api_client.get(profile_url)
         assert profile_response.status_code == status.HTTP_200_OK
 
     @pytest.mark.django_db
-    def test_access_token_expiry_simulation(self, api_client, user):
+    def test_blacklisted_refresh_token_is_rejected(self, tokens):
+        """Test a refresh token cannot be reused once it is blacklisted."""
+        RefreshToken(tokens["refresh"]).blacklist()
+
+        with pytest.raises(TokenError):
+            RefreshToken(tokens["refresh"]).check_blacklist()
+
+    @pytest.mark.django_db
+    def test_access_token_expiry_simulation(self, signed_in_client):
         """Test refresh token flow works correctly with cookies."""
-        # Sign in first to establish session with valid tokens
-        signin_data = {
-            "username": user.username,
-            "password": "TestPass123!",
-        }  # Updated password
-        signin_url = reverse("user-signin")
-        signin_response = api_client.post(signin_url, signin_data, format="json")
-        assert signin_response.status_code == status.HTTP_200_OK
-        assert "jwt_access_token" in signin_response.cookies
-        assert "jwt_refresh_token" in signin_response.cookies
+        api_client = signed_in_client
 
         # Verify we can access protected resources initially
         profile_url = reverse("user-profile")
@@ -263,18 +239,16 @@ class TestSecurityFeatures:
         assert profile_response_after_refresh.status_code == status.HTTP_200_OK
 
     @pytest.mark.django_db
-    def test_invalid_token_format_handling(self, api_client):
-        """Test handling of malformed tokens in cookies."""
-        profile_url = reverse("user-profile")
-
-        # Test various malformed tokens in cookies
-        malformed_tokens = [
+    @pytest.mark.parametrize(
+        "token",
+        [
             "invalid_token",
             "",
             "eyJ0eXAiOiJKV1QiLCJhbGciOiJIUzI1NiJ9.invalid",
-        ]
-
-        for token in malformed_tokens:
-            api_client.cookies["jwt_access_token"] = token
-            response = api_client.get(profile_url)
-            assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        ],
+    )
+    def test_malformed_token(self, api_client, token):
+        """Test handling of malformed tokens in cookies."""
+        api_client.cookies["jwt_access_token"] = token
+        response = api_client.get(reverse("user-profile"))
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
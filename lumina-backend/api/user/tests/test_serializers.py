@@ -1,6 +1,7 @@
 """Unit tests for user serializers."""
 
 import pytest
+from rest_framework.validators import UniqueValidator
 
 from api.user.serializers import (
     PasswordChangeSerializer,
@@ -11,6 +12,20 @@ from api.user.serializers import (
 )
 
 
+@pytest.fixture
+def _no_user_uniqueness_check(monkeypatch):
+    """Skip the username uniqueness query for tests that don't exercise it."""
+    monkeypatch.setattr(UniqueValidator, "__call__", lambda *_: None)
+
+
+@pytest.fixture
+def password_change_request(request_factory, user):
+    """Fixture for a request made by `user`, as PasswordChangeSerializer expects."""
+    request = request_factory.post("/")
+    request.user = user
+    return request
+
+
 @pytest.mark.unit
 class TestUserRegistrationSerializer:
     """Test cases for UserRegistrationSerializer."""
@@ -27,7 +42,7 @@ class TestUserRegistrationSerializer:
         assert user.last_name == user_data["last_name"]
         assert user.check_password(user_data["password"])
 
-    @pytest.mark.django_db
+    @pytest.mark.usefixtures("_no_user_uniqueness_check")
     def test_password_mismatch(self, user_data):
         """Test validation error when passwords don't match."""
         user_data["password_confirm"] = "DifferentPass123!"
@@ -36,7 +51,7 @@ class TestUserRegistrationSerializer:
         assert "password_confirm" in serializer.errors
         assert "Passwords don't match" in str(serializer.errors["password_confirm"])
 
-    @pytest.mark.django_db
+    @pytest.mark.usefixtures("_no_user_uniqueness_check")
     def test_missing_required_fields(self):
         """Test validation error when required fields are missing."""
         incomplete_data = {"username": "test"}
@@ -45,15 +60,6 @@ class TestUserRegistrationSerializer:
         assert "password" in serializer.errors
         assert "password_confirm" in serializer.errors
 
-    @pytest.mark.django_db
-    def test_short_password(self, user_data):
-        """Test validation error for password less than 8 characters."""
-        user_data["password"] = "short"
-        user_data["password_confirm"] = "short"
-        serializer = UserRegistrationSerializer(data=user_data)
-        assert not serializer.is_valid()
-        assert "password" in serializer.errors
-
     @pytest.mark.django_db
     def test_duplicate_username(self, user_data, user):
         """Test validation error for duplicate username."""
@@ -71,45 +77,38 @@ class TestUserRegistrationSerializer:
         # Verify password works (if it was set twice, it would fail)
         assert user.check_password(user_data["password"])
 
-    @pytest.mark.django_db
-    def test_password_complexity_missing_uppercase(self, user_data):
-        """Test validation error for password without uppercase letter."""
-        weak_password = "password123!"
+    @pytest.mark.usefixtures("_no_user_uniqueness_check")
+    @pytest.mark.parametrize(
+        ("weak_password", "error_substring"),
+        [
+            ("short", "at least 8"),
+            ("password123!", "uppercase letter"),
+            ("PASSWORD123!", "lowercase letter"),
+            ("UncommonPasswordWithoutNumber!", "number"),
+            ("UncommonPassword123WithoutSpecialChar", "special character"),
+        ],
+    )
+    def test_weak_password(self, user_data, weak_password, error_substring):
+        """Test validation error for passwords failing a strength rule."""
         user_data["password"] = weak_password
         user_data["password_confirm"] = weak_password
         serializer = UserRegistrationSerializer(data=user_data)
         assert not serializer.is_valid()
-        assert "uppercase letter" in str(serializer.errors)
+        assert error_substring in str(serializer.errors["password"])
 
-    @pytest.mark.django_db
-    def test_password_complexity_missing_lowercase(self, user_data):
-        """Test validation error for password without lowercase letter."""
-        weak_password = "PASSWORD123!"
+    @pytest.mark.usefixtures("_no_user_uniqueness_check")
+    def test_password_complexity_reports_all_missing_classes(self, user_data):
+        """Test that every missing character class is reported together."""
+        weak_password = "uncommonpasswordwithoutanything"
         user_data["password"] = weak_password
         user_data["password_confirm"] = weak_password
         serializer = UserRegistrationSerializer(data=user_data)
         assert not serializer.is_valid()
-        assert "lowercase letter" in str(serializer.errors)
-
-    @pytest.mark.django_db
-    def test_password_complexity_missing_number(self, user_data):
-        """Test validation error for password without number."""
-        weak_password = "UncommonPasswordWithoutNumber!"
-        user_data["password"] = weak_password
-        user_data["password_confirm"] = weak_password
-        serializer = UserRegistrationSerializer(data=user_data)
-        assert not serializer.is_valid()
-        assert "number" in str(serializer.errors)
-
-    @pytest.mark.django_db
-    def test_password_complexity_missing_special_char(self, user_data):
-        """Test validation error for password without special character."""
-        weak_password = "UncommonPassword123WithoutSpecialChar"
-        user_data["password"] = weak_password
-        user_data["password_confirm"] = weak_password
-        serializer = UserRegistrationSerializer(data=user_data)
-        assert not serializer.is_valid()
-        assert "special character" in str(serializer.errors)
+        errors = serializer.errors["password"]
+        assert len(errors) == 3
+        assert "uppercase letter" in str(errors)
+        assert "number" in str(errors)
+        assert "special character" in str(errors)
 
     @pytest.mark.django_db
     def test_password_complexity_valid_strong_password(self, user_data):
@@ -150,7 +149,6 @@ class TestUserLoginSerializer:
         assert not serializer.is_valid()
         assert "Invalid credentials" in str(serializer.errors)
 
-    @pytest.mark.django_db
     def test_missing_username(self):
         """Test validation error when username is missing."""
         data = {"password": "testpass123"}
@@ -158,7 +156,6 @@ class TestUserLoginSerializer:
         assert not serializer.is_valid()
         assert "Username is required" in str(serializer.errors)
 
-    @pytest.mark.django_db
     def test_missing_password(self):
         """Test validation error when password is missing."""
         data = {"username": "testuser"}
@@ -166,6 +163,13 @@ class TestUserLoginSerializer:
         assert not serializer.is_valid()
         assert "Password is required" in str(serializer.errors)
 
+    def test_blank_credentials(self):
+        """Test blank credentials are reported as required."""
+        serializer = UserLoginSerializer(data={"username": "", "password": ""})
+        assert not serializer.is_valid()
+        assert serializer.errors["username"] == ["Username is required"]
+        assert serializer.errors["password"] == ["Password is required"]
+
     @pytest.mark.django_db
     def test_wrong_password(self, user):
         """Test generic error for wrong password."""
@@ -191,6 +195,13 @@ class TestUserProfileSerializer:
         assert data["last_name"] == user.last_name
         assert "date_joined" in data
 
+    @pytest.mark.django_db
+    def test_serialize_matches_model_serializer(self, user):
+        """Test the hand-built profile matches ModelSerializer's output."""
+        serializer = UserProfileSerializer(user)
+        expected = super(UserProfileSerializer, serializer).to_representation(user)
+        assert serializer.data == expected
+
     @pytest.mark.django_db
     def test_update_profile(self, user):
         """Test updating user profile."""
@@ -223,12 +234,12 @@ class TestPasswordChangeSerializer:
     """Test cases for PasswordChangeSerializer."""
 
     @pytest.mark.django_db
-    def test_valid_password_change(self, user, password_change_data, request_factory):
+    def test_valid_password_change(
+        self, user, password_change_data, password_change_request
+    ):
         """Test valid password change."""
-        request = request_factory.post("/")
-        request.user = user
         serializer = PasswordChangeSerializer(
-            data=password_change_data, context={"request": request}
+            data=password_change_data, context={"request": password_change_request}
         )
         assert serializer.is_valid()
         serializer.save()
@@ -236,25 +247,23 @@ class TestPasswordChangeSerializer:
         assert user.check_password(password_change_data["new_password"])
 
     @pytest.mark.django_db
-    def test_wrong_current_password(self, user, password_change_data, request_factory):
+    def test_wrong_current_password(
+        self, password_change_data, password_change_request
+    ):
         """Test validation error for wrong current password."""
-        request = request_factory.post("/")
-        request.user = user
         password_change_data["current_password"] = "wrongpass"
         serializer = PasswordChangeSerializer(
-            data=password_change_data, context={"request": request}
+            data=password_change_data, context={"request": password_change_request}
         )
         assert not serializer.is_valid()
         assert "Current password is incorrect" in str(serializer.errors)
 
     @pytest.mark.django_db
-    def test_new_password_mismatch(self, user, password_change_data, request_factory):
+    def test_new_password_mismatch(self, password_change_data, password_change_request):
         """Test validation error when new passwords don't match."""
-        request = request_factory.post("/")
-        request.user = user
         password_change_data["new_password_confirm"] = "DifferentPass123!"
         serializer = PasswordChangeSerializer(
-            data=password_change_data, context={"request": request}
+            data=password_change_data, context={"request": password_change_request}
         )
         assert not serializer.is_valid()
         assert "new_password_confirm" in serializer.errors
@@ -263,11 +272,8 @@ class TestPasswordChangeSerializer:
         )
 
     @pytest.mark.django_db
-    def test_new_password_complexity_validation(self, user, request_factory):
+    def test_new_password_complexity_validation(self, password_change_request):
         """Test new password complexity validation in password change."""
-        request = request_factory.post("/")
-        request.user = user
-
         # Test with weak password
         weak_data = {
             "current_password": "TestPass123!",
@@ -275,36 +281,33 @@ class TestPasswordChangeSerializer:
             "new_password_confirm": "weak",
         }
         serializer = PasswordChangeSerializer(
-            data=weak_data, context={"request": request}
+            data=weak_data, context={"request": password_change_request}
         )
         assert not serializer.is_valid()
         assert "new_password" in serializer.errors
 
     @pytest.mark.django_db
-    def test_new_password_strength_requirements(self, user, request_factory):
+    def test_new_password_strength_requirements(self, password_change_request):
         """Test all password strength requirements for new password."""
-        request = request_factory.post("/")
-        request.user = user
-
         # Test missing uppercase
         data = {
             "current_password": "TestPass123!",
             "new_password": "password123!",
             "new_password_confirm": "password123!",
         }
-        serializer = PasswordChangeSerializer(data=data, context={"request": request})
+        serializer = PasswordChangeSerializer(
+            data=data, context={"request": password_change_request}
+        )
         assert not serializer.is_valid()
         assert "uppercase letter" in str(serializer.errors)
 
     @pytest.mark.django_db
-    def test_short_new_password(self, user, password_change_data, request_factory):
+    def test_short_new_password(self, password_change_data, password_change_request):
         """Test validation error for short new password."""
-        request = request_factory.post("/")
-        request.user = user
         password_change_data["new_password"] = "short"
         password_change_data["new_password_confirm"] = "short"
         serializer = PasswordChangeSerializer(
-            data=password_change_data, context={"request": request}
+            data=password_change_data, context={"request": password_change_request}
         )
         assert not serializer.is_valid()
         assert "new_password" in serializer.errors
@@ -2,8 +2,21 @@
 
 import pytest
 from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import IntegrityError
 from django.urls import reverse
 from rest_framework import status
+from rest_framework.test import APIClient, APIRequestFactory, force_authenticate
+
+from api.authentication import get_user_cache_key
+from api.user.serializers import UserRegistrationSerializer
+from api.user.views import LogoutView, SignInView, SignUpView, UserProfileView
+
+
+@pytest.fixture(scope="module")
+def api_request_factory():
+    """Fixture for dispatching requests straight to a view, skipping middleware."""
+    return APIRequestFactory()
 
 
 @pytest.mark.unit
@@ -39,6 +52,30 @@ class TestSignUpView:
         user = User.objects.get(username=user_data["username"])
         assert user.email == user_data["email"]
 
+    @pytest.mark.django_db
+    def test_signup_query_count(self, api_client, user_data, django_assert_num_queries):
+        """Test signup doesn't issue extra writes after creating the user."""
+        url = reverse("user-signup")
+        # Username check, user INSERT, refresh token INSERT
+        with django_assert_num_queries(3):
+            response = api_client.post(url, user_data, format="json")
+
+        assert response.status_code == status.HTTP_201_CREATED
+
+    @pytest.mark.django_db
+    def test_signup_username_race(self, api_client, user_data, monkeypatch):
+        """Test a username taken after validation is reported as a 400."""
+
+        def save(_serializer):
+            raise IntegrityError
+
+        monkeypatch.setattr(UserRegistrationSerializer, "save", save)
+        url = reverse("user-signup")
+        response = api_client.post(url, user_data, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "username" in response.data
+
     @pytest.mark.django_db
     def test_signup_validation_errors(self, api_client):
         """Test signup with validation errors."""
@@ -61,30 +98,6 @@ class TestSignUpView:
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
-    @pytest.mark.django_db
-    def test_signup_rate_limiting(self, api_client, user_data):
-        """Test rate limiting decorator is applied to signup view."""
-        from api.user.views import SignUpView
-
-        # Verify the ratelimit decorator is applied to the view
-        # Check that the view has the decorator's wrapper attributes
-        view_instance = SignUpView()
-        post_method = view_instance.post
-
-        # The ratelimit decorator adds attributes to the wrapped method
-        # We can check if these exist to verify the decorator is applied
-        assert (
-            hasattr(post_method, "__wrapped__")
-            or hasattr(post_method.__class__, "__wrapped__")
-            or hasattr(view_instance.__class__, "__wrapped__")
-            or "ratelimit" in str(view_instance.__class__.post)
-        )
-
-        # Also test that the endpoint works normally
-        url = reverse("user-signup")
-        response = api_client.post(url, user_data, format="json")
-        assert response.status_code == status.HTTP_201_CREATED
-
 
 @pytest.mark.unit
 class TestSignInView:
@@ -134,27 +147,42 @@ class TestSignInView:
 
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
-    @pytest.mark.django_db
-    def test_signin_rate_limiting(self, api_client, user, login_data):
-        """Test rate limiting decorator is applied to signin view."""
-        from api.user.views import SignInView
-
-        # Verify the ratelimit decorator is applied to the view
-        view_instance = SignInView()
-        post_method = view_instance.post
-
-        # The ratelimit decorator adds attributes to the wrapped method
-        assert (
-            hasattr(post_method, "__wrapped__")
-            or hasattr(post_method.__class__, "__wrapped__")
-            or hasattr(view_instance.__class__, "__wrapped__")
-            or "ratelimit" in str(view_instance.__class__.post)
-        )
-
-        # Also test that the endpoint works normally
-        url = reverse("user-signin")
-        response = api_client.post(url, login_data, format="json")
-        assert response.status_code == status.HTTP_200_OK
+
+@pytest.mark.unit
+@pytest.mark.parametrize("view_cls", [SignUpView, SignInView])
+def test_auth_view_is_rate_limited(view_cls):
+    """Test rate limiting decorator is applied to the auth view."""
+    view_instance = view_cls()
+    post_method = view_instance.post
+
+    # The ratelimit decorator adds attributes to the wrapped method
+    assert (
+        hasattr(post_method, "__wrapped__")
+        or hasattr(post_method.__class__, "__wrapped__")
+        or hasattr(view_instance.__class__, "__wrapped__")
+        or "ratelimit" in str(view_instance.__class__.post)
+    )
+
+
+@pytest.mark.django_db
+def test_signin_rejects_requests_over_rate_limit(
+    api_client, invalid_login_data, settings
+):
+    """Test signin attempts beyond the rate limit are refused."""
+    settings.CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "test-signin-rate-limit",
+        }
+    }
+    url = reverse("user-signin")
+    limit = int(settings.AUTH_SIGNIN_RATE_LIMIT.split("/")[0])
+    for _ in range(limit):
+        response = api_client.post(url, invalid_login_data, format="json")
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    response = api_client.post(url, invalid_login_data, format="json")
+    assert response.status_code == status.HTTP_403_FORBIDDEN
 
 
 @pytest.mark.unit
@@ -162,30 +190,72 @@ class TestLogoutView:
     """Test cases for LogoutView."""
 
     @pytest.mark.django_db
-    def test_successful_logout(self, authenticated_client, tokens):
+    def test_successful_logout(self, api_request_factory, user, tokens):
         """Test successful logout with token blacklisting."""
+        data = {"refresh_token": tokens["refresh"]}
+        request = api_request_factory.post("/", data, format="json")
+        force_authenticate(request, user=user)
+        response = LogoutView.as_view()(request)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert "message" in response.data
+
+    @pytest.mark.django_db
+    def test_logout_revokes_access_token(self, authenticated_client, tokens, settings):
+        """Test the access token used to log out is rejected afterwards."""
+        settings.CACHES = {
+            "default": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                "LOCATION": "test-revoked-token-cache",
+            }
+        }
         url = reverse("user-logout")
         data = {"refresh_token": tokens["refresh"]}
         response = authenticated_client.post(url, data, format="json")
+        assert response.status_code == status.HTTP_200_OK
+        # Drop the emptied cookies as a browser would, leaving only the header
+        authenticated_client.cookies.clear()
+
+        response = authenticated_client.get(reverse("user-profile"))
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert response.data["code"] == "token_revoked"
 
+    @pytest.mark.django_db
+    def test_logout_revokes_access_token_without_cache(
+        self, authenticated_client, tokens, settings
+    ):
+        """Test revocation holds when the cache stores nothing."""
+        settings.CACHES = {
+            "default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}
+        }
+        url = reverse("user-logout")
+        data = {"refresh_token": tokens["refresh"]}
+        response = authenticated_client.post(url, data, format="json")
         assert response.status_code == status.HTTP_200_OK
-        assert "message" in response.data
+        # Drop the emptied cookies as a browser would, leaving only the header
+        authenticated_client.cookies.clear()
+
+        response = authenticated_client.get(reverse("user-profile"))
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert response.data["code"] == "token_revoked"
 
     @pytest.mark.django_db
-    def test_logout_invalid_token(self, authenticated_client):
+    def test_logout_invalid_token(self, api_request_factory, user):
         """Test logout with invalid refresh token."""
-        url = reverse("user-logout")
         data = {"refresh_token": "invalid_token"}
-        response = authenticated_client.post(url, data, format="json")
+        request = api_request_factory.post("/", data, format="json")
+        force_authenticate(request, user=user)
+        response = LogoutView.as_view()(request)
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert "error" in response.data
 
     @pytest.mark.django_db
-    def test_logout_no_token(self, authenticated_client):
+    def test_logout_no_token(self, api_request_factory, user):
         """Test logout without refresh token."""
-        url = reverse("user-logout")
-        response = authenticated_client.post(url, {}, format="json")
+        request = api_request_factory.post("/", {}, format="json")
+        force_authenticate(request, user=user)
+        response = LogoutView.as_view()(request)
 
         # Should still return success (no token to blacklist)
         assert response.status_code == status.HTTP_200_OK
@@ -204,30 +274,84 @@ class TestUserProfileView:
     """Test cases for UserProfileView."""
 
     @pytest.mark.django_db
-    def test_get_user_profile(self, authenticated_client, user):
+    def test_get_user_profile(self, api_request_factory, user):
         """Test retrieving user profile."""
-        url = reverse("user-profile")
-        response = authenticated_client.get(url)
+        request = api_request_factory.get("/")
+        force_authenticate(request, user=user)
+        response = UserProfileView.as_view()(request)
 
         assert response.status_code == status.HTTP_200_OK
         assert response.data["username"] == user.username
         assert response.data["email"] == user.email
 
     @pytest.mark.django_db
-    def test_update_user_profile(self, authenticated_client, user):
+    def test_update_user_profile(self, api_request_factory, user):
         """Test updating user profile."""
-        url = reverse("user-profile")
         update_data = {
             "first_name": "Updated",
             "last_name": "Name",
             "email": "updated@example.com",
         }
-        response = authenticated_client.put(url, update_data, format="json")
+        request = api_request_factory.put("/", update_data, format="json")
+        force_authenticate(request, user=user)
+        response = UserProfileView.as_view()(request)
 
         assert response.status_code == status.HTTP_200_OK
         assert response.data["first_name"] == "Updated"
         assert response.data["email"] == "updated@example.com"
 
+    @pytest.mark.django_db
+    def test_authenticated_user_is_cached(
+        self, authenticated_client, user, settings, django_assert_num_queries
+    ):
+        """Test the authenticated user is reused until their row changes."""
+        settings.CACHES = {
+            "default": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                "LOCATION": "test-auth-user-cache",
+            }
+        }
+        url = reverse("user-profile")
+        authenticated_client.get(url)
+
+        with django_assert_num_queries(0):
+            response = authenticated_client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+
+        user.is_active = False
+        user.save()
+        response = authenticated_client.get(url)
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    @pytest.mark.django_db
+    def test_profile_cached_user_excludes_password_and_rechecks_active(
+        self, authenticated_client, user, settings
+    ):
+        """Test the cached user holds no password hash and stays checked."""
+        settings.CACHES = {
+            "default": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                "LOCATION": "test-auth-user-snapshot-cache",
+            }
+        }
+        url = reverse("user-profile")
+        assert authenticated_client.get(url).status_code == status.HTTP_200_OK
+
+        key = get_user_cache_key(user.id)
+        snapshot = cache.get(key)
+        assert "password" not in dict(snapshot["fields"])
+        assert user.password not in str(snapshot)
+
+        # Deactivate without signals, as QuerySet.update() would
+        snapshot["fields"] = [
+            (name, False if name == "is_active" else value)
+            for name, value in snapshot["fields"]
+        ]
+        cache.set(key, snapshot)
+        response = authenticated_client.get(url)
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert response.data["code"] == "user_inactive"
+
     @pytest.mark.django_db
     def test_profile_requires_authentication(self, api_client):
         """Test profile access requires authentication."""
@@ -256,6 +380,30 @@ class TestPasswordChangeView:
         user.refresh_from_db()
         assert user.check_password(password_change_data["new_password"])
 
+    @pytest.mark.django_db
+    def test_password_change_rejects_old_token_for_cached_user(
+        self, authenticated_client, tokens, password_change_data, settings
+    ):
+        """Test old tokens are rejected even when the user comes from cache."""
+        settings.CACHES = {
+            "default": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                "LOCATION": "test-password-change-cache",
+            }
+        }
+        url = reverse("user-change-password")
+        response = authenticated_client.post(url, password_change_data, format="json")
+        assert response.status_code == status.HTTP_200_OK
+
+        # The new cookie authenticates and re-caches the user
+        profile_url = reverse("user-profile")
+        assert authenticated_client.get(profile_url).status_code == status.HTTP_200_OK
+
+        old_client = APIClient()
+        old_client.credentials(HTTP_AUTHORIZATION=f"Bearer {tokens['access']}")
+        response = old_client.get(profile_url)
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
     @pytest.mark.django_db
     def test_password_change_wrong_current(
         self, authenticated_client, password_change_data
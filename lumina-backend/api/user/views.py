@@ -3,36 +3,43 @@
 import logging
 
 from django.conf import settings
+from django.db import IntegrityError
 from django.utils.decorators import method_decorator
 from django.views.decorators.csrf import csrf_exempt
+from django_ratelimit.decorators import ratelimit
 from rest_framework import status
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
 from rest_framework_simplejwt.tokens import RefreshToken
 
+from api.authentication import revoke_access_token
+
 logger = logging.getLogger(__name__)
 
 
 def set_jwt_cookies(response, tokens):
     """Set JWT tokens as httpOnly cookies."""
+    # Shared by both cookies; read per call so overridden settings apply
+    cookie_options = {
+        "path": "/",  # Ensure cookies are accessible for all API routes
+        "httponly": settings.JWT_COOKIE_HTTPONLY,
+        "secure": settings.JWT_COOKIE_SECURE,
+        "samesite": settings.JWT_COOKIE_SAMESITE,
+    }
     response.set_cookie(
         settings.JWT_COOKIE_NAME,
         tokens["access_token"],
         max_age=settings.JWT_COOKIE_MAX_AGE,
-        path="/",  # Ensure cookies are accessible for all API routes
-        httponly=settings.JWT_COOKIE_HTTPONLY,
-        secure=settings.JWT_COOKIE_SECURE,
-        samesite=settings.JWT_COOKIE_SAMESITE,
+        **cookie_options,
     )
     response.set_cookie(
         settings.JWT_REFRESH_COOKIE_NAME,
         tokens["refresh_token"],
         max_age=settings.JWT_REFRESH_COOKIE_MAX_AGE,
-        path="/",  # Ensure cookies are accessible for all API routes
-        httponly=settings.JWT_COOKIE_HTTPONLY,
-        secure=settings.JWT_COOKIE_SECURE,
-        samesite=settings.JWT_COOKIE_SAMESITE,
+        **cookie_options,
     )
     return response
 
@@ -62,6 +69,12 @@ from .serializers import (
 
 
 @method_decorator(csrf_exempt, name="dispatch")
+@method_decorator(
+    ratelimit(
+        key="ip", rate=settings.AUTH_SIGNUP_RATE_LIMIT, method="POST", block=True
+    ),
+    name="post",
+)
 class SignUpView(APIView):
     """User registration view."""
 
@@ -73,34 +86,43 @@ class SignUpView(APIView):
         if serializer.is_valid():
             try:
                 user = serializer.save()
-                tokens = TokenSerializer.get_tokens_for_user(user)
-                user_data = UserProfileSerializer(user).data
-
-                logger.info(f"User registered successfully: {user.username}")
-                response = Response(
-                    {
-                        "message": "User registered successfully",
-                        "user": user_data,
-                    },
-                    status=status.HTTP_201_CREATED,
-                )
-                return set_jwt_cookies(response, tokens)
-            except Exception as e:
-                logger.error(
-                    f"Registration failed for user: {request.data.get('username', 'unknown')}: {str(e)}"
+            except IntegrityError:
+                # A concurrent signup took the username after validation ran
+                logger.warning(
+                    "Registration raced on username: %s",
+                    serializer.validated_data["username"],
                 )
                 return Response(
-                    {"error": "Registration failed. Please try again."},
-                    status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    {"username": ["A user with that username already exists."]},
+                    status=status.HTTP_400_BAD_REQUEST,
                 )
 
+            tokens = TokenSerializer.get_tokens_for_user(user)
+            user_data = UserProfileSerializer(user).data
+
+            logger.info("User registered successfully: %s", user.username)
+            response = Response(
+                {
+                    "message": "User registered successfully",
+                    "user": user_data,
+                },
+                status=status.HTTP_201_CREATED,
+            )
+            return set_jwt_cookies(response, tokens)
+
         logger.warning(
-            f"Registration attempt with invalid data: {list(serializer.errors.keys())}"
+            "Registration attempt with invalid data: %s", list(serializer.errors)
         )
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
 @method_decorator(csrf_exempt, name="dispatch")
+@method_decorator(
+    ratelimit(
+        key="ip", rate=settings.AUTH_SIGNIN_RATE_LIMIT, method="POST", block=True
+    ),
+    name="post",
+)
 class SignInView(APIView):
     """User login view."""
 
@@ -110,32 +132,23 @@ class SignInView(APIView):
         """Handle user login."""
         serializer = UserLoginSerializer(data=request.data)
         if serializer.is_valid():
-            try:
-                user = serializer.validated_data["user"]
-                tokens = TokenSerializer.get_tokens_for_user(user)
-                user_data = UserProfileSerializer(user).data
-
-                logger.info(f"User logged in successfully: {user.username}")
-                response = Response(
-                    {
-                        "message": "Login successful",
-                        "user": user_data,
-                    },
-                    status=status.HTTP_200_OK,
-                )
-                return set_jwt_cookies(response, tokens)
-            except Exception as e:
-                logger.error(
-                    f"Login failed for user: {request.data.get('username', 'unknown')}: {str(e)}"
-                )
-                return Response(
-                    {"error": "Login failed. Please try again."},
-                    status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                )
+            user = serializer.validated_data["user"]
+            tokens = TokenSerializer.get_tokens_for_user(user)
+            user_data = UserProfileSerializer(user).data
+
+            logger.info("User logged in successfully: %s", user.username)
+            response = Response(
+                {
+                    "message": "Login successful",
+                    "user": user_data,
+                },
+                status=status.HTTP_200_OK,
+            )
+            return set_jwt_cookies(response, tokens)
 
         # Log failed login attempts without exposing whether username exists
         username = request.data.get("username", "unknown")
-        logger.warning(f"Failed login attempt for username: {username}")
+        logger.warning("Failed login attempt for username: %s", username)
 
         # Always return generic error message
         return Response(
@@ -157,21 +170,26 @@ class LogoutView(APIView):
             if not refresh_token:
                 refresh_token = request.data.get("refresh_token")
 
+            # Revoke the access token too, rather than leaving it usable
+            # until it expires
+            if request.auth is not None:
+                revoke_access_token(request.auth)
+
             if refresh_token:
                 token = RefreshToken(refresh_token)
                 token.blacklist()
-                logger.info(f"User logged out successfully: {request.user.username}")
+                logger.info("User logged out successfully: %s", request.user.username)
             else:
                 logger.warning(
-                    f"Logout attempt without refresh token: {request.user.username}"
+                    "Logout attempt without refresh token: %s", request.user.username
                 )
 
             response = Response(
                 {"message": "Logout successful"}, status=status.HTTP_200_OK
             )
             return clear_jwt_cookies(response)
-        except Exception as e:
-            logger.error(f"Logout failed for user {request.user.username}: {str(e)}")
+        except TokenError as e:
+            logger.error("Logout failed for user %s: %s", request.user.username, e)
             response = Response(
                 {"error": "Logout failed. Please try again."},
                 status=status.HTTP_400_BAD_REQUEST,
@@ -209,10 +227,14 @@ class PasswordChangeView(APIView):
             data=request.data, context={"request": request}
         )
         if serializer.is_valid():
-            serializer.save()
-            return Response(
+            user = serializer.save()
+            # Existing tokens are invalidated by the new password, so keep
+            # this session signed in with freshly issued ones
+            tokens = TokenSerializer.get_tokens_for_user(user)
+            response = Response(
                 {"message": "Password changed successfully"}, status=status.HTTP_200_OK
             )
+            return set_jwt_cookies(response, tokens)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
@@ -238,12 +260,16 @@ class JWTCookieTokenRefreshView(APIView):
             token = RefreshToken(refresh_token)
             new_access_token = str(token.access_token)
 
-            # If rotation is enabled, get new refresh token
-            new_refresh_token = (
-                str(token)
-                if settings.SIMPLE_JWT.get("ROTATE_REFRESH_TOKENS", False)
-                else refresh_token
-            )
+            # If rotation is enabled, reissue the refresh token under a new
+            # jti; otherwise the cookie keeps the token it already holds
+            new_refresh_token = refresh_token
+            if jwt_settings.ROTATE_REFRESH_TOKENS:
+                if jwt_settings.BLACKLIST_AFTER_ROTATION:
+                    token.blacklist()
+                token.set_jti()
+                token.set_exp()
+                token.set_iat()
+                new_refresh_token = str(token)
 
             tokens = {
                 "access_token": new_access_token,
@@ -256,8 +282,8 @@ class JWTCookieTokenRefreshView(APIView):
 
             return set_jwt_cookies(response, tokens)
 
-        except Exception as e:
-            logger.error(f"Token refresh failed: {str(e)}")
+        except TokenError as e:
+            logger.error("Token refresh failed: %s", e)
             return Response(
                 {"error": "Token refresh failed"}, status=status.HTTP_401_UNAUTHORIZED
             )
@@ -23,6 +23,8 @@ def configure_test_settings():
     }
     # Also disable rate limiting by setting a high limit for tests
     settings.RATELIMIT_ENABLE = getattr(settings, "RATELIMIT_ENABLE", True)
+    # Hash test passwords cheaply; production hashers are deliberately slow
+    settings.PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
 
 
 from django.contrib.auth.models import User
@@ -102,6 +104,14 @@ def authenticated_client(api_client, tokens):
     return api_client
 
 
+@pytest.fixture
+def signed_in_client(api_client, tokens):
+    """Fixture for an API client holding the JWT cookies signin would set."""
+    api_client.cookies[settings.JWT_COOKIE_NAME] = tokens["access"]
+    api_client.cookies[settings.JWT_REFRESH_COOKIE_NAME] = tokens["refresh"]
+    return api_client
+
+
 @pytest.fixture
 def login_data():
     """Fixture for login data."""
@@ -134,6 +134,9 @@ class PomodoroSessionAdmin(admin.ModelAdmin):
         "remaining_minutes",
     ]
     date_hierarchy = "started_at"
+    # Task.__str__ reads the task's user, so follow that relation as well
+    list_select_related = ("user", "task__user")
+    raw_id_fields = ("user", "task")
 
     fieldsets = (
         ("Basic Information", {"fields": ("user", "task", "session_type", "status")}),
@@ -166,7 +169,3 @@ class PomodoroSessionAdmin(admin.ModelAdmin):
             {"fields": ("created_at", "updated_at"), "classes": ("collapse",)},
         ),
     )
-
-    def get_queryset(self, request):
-        """Optimize queryset with select_related."""
-        return super().get_queryset(request).select_related("user", "task")
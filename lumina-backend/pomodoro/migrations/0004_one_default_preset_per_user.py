@@ -0,0 +1,36 @@
+# Generated by Django 5.2.6 on 2026-10-15 16:04
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def unset_duplicate_defaults(apps, schema_editor):
+    """Keep only the most recently updated default preset per user."""
+    PomodoroPreset = apps.get_model('pomodoro', 'PomodoroPreset')
+    seen_users = set()
+    duplicate_ids = []
+    for preset_id, user_id in (
+        PomodoroPreset.objects.filter(is_default=True)
+        .order_by('user_id', '-updated_at', '-id')
+        .values_list('id', 'user_id')
+    ):
+        if user_id in seen_users:
+            duplicate_ids.append(preset_id)
+        seen_users.add(user_id)
+    PomodoroPreset.objects.filter(id__in=duplicate_ids).update(is_default=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pomodoro', '0003_pomodorosession_pomodoro_user_status_idx_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(unset_duplicate_defaults, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='pomodoropreset',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_default', True)), fields=('user',), name='one_default_preset_per_user'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.6 on 2026-10-15 16:28
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('pomodoro', '0004_one_default_preset_per_user'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='pomodoropreset',
+            unique_together=set(),
+        ),
+        migrations.AddConstraint(
+            model_name='pomodoropreset',
+            constraint=models.UniqueConstraint(fields=('user', 'name'), name='unique_preset_name_per_user'),
+        ),
+    ]
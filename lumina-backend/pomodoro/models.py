@@ -1,11 +1,15 @@
 """Pomodoro timer models for Lumina."""
 
+from datetime import timedelta
+
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
 from django.core.validators import MaxValueValidator, MinValueValidator
-from django.db import models
+from django.db import models, transaction
+from django.db.models.functions import Coalesce, Extract, Now
 from django.utils import timezone
 
+from api.models import FieldTrackingMixin
 from api.task.models import Task, sanitize_text_input, validate_text_length
 
 
@@ -80,7 +84,18 @@ class PomodoroSettings(models.Model):
         return f"{self.user.username}'s Pomodoro Settings"
 
 
-class PomodoroPreset(models.Model):
+# Named so that a duplicate preset name or default can be told apart from
+# other integrity errors
+PRESET_NAME_CONSTRAINT = "unique_preset_name_per_user"
+DEFAULT_PRESET_CONSTRAINT = "one_default_preset_per_user"
+
+
+def get_violated_constraint(error):
+    """Return the name of the constraint an IntegrityError violated, if known."""
+    return getattr(getattr(error.__cause__, "diag", None), "constraint_name", None)
+
+
+class PomodoroPreset(FieldTrackingMixin, models.Model):
     """Predefined timer configurations that users can save and reuse."""
 
     user = models.ForeignKey(
@@ -110,15 +125,25 @@ class PomodoroPreset(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
-        unique_together = ["user", "name"]
         ordering = ["name"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "name"],
+                name=PRESET_NAME_CONSTRAINT,
+            ),
+            models.UniqueConstraint(
+                fields=["user"],
+                condition=models.Q(is_default=True),
+                name=DEFAULT_PRESET_CONSTRAINT,
+            ),
+        ]
 
     def clean(self):
         """Validate and sanitize preset data."""
         super().clean()
 
-        # Sanitize name
-        if self.name:
+        # Sanitize name, unless it is the already-sanitized stored value
+        if self.name and self.field_changed("name"):
             self.name = sanitize_text_input(self.name)
             validate_text_length(self.name, 100)
 
@@ -128,21 +153,59 @@ class PomodoroPreset(models.Model):
 
     def save(self, *args, **kwargs):
         """Override save to ensure validation and handle default preset."""
-        self.full_clean()
-
-        # If this is set as default, unset other defaults for this user
-        if self.is_default:
-            PomodoroPreset.objects.filter(user=self.user, is_default=True).update(
-                is_default=False
-            )
-
-        super().save(*args, **kwargs)
+        # Unique names and the single default per user are enforced by the
+        # database constraints (and by unsetting the previous default below),
+        # so skip the queries that would check them up front
+        self.full_clean(validate_unique=False, validate_constraints=False)
+
+        # If this just became the default, unset other defaults for this user
+        # in the same transaction; saves that leave the flag unchanged skip it
+        if self.is_default and self.field_changed("is_default"):
+            with transaction.atomic():
+                PomodoroPreset.objects.filter(
+                    user_id=self.user_id, is_default=True
+                ).exclude(pk=self.pk).update(is_default=False)
+                super().save(*args, **kwargs)
+        else:
+            super().save(*args, **kwargs)
+        self.snapshot_field_values()
 
     def __str__(self):
         return f"{self.user.username} - {self.name}"
 
 
-class PomodoroSession(models.Model):
+class PomodoroSessionQuerySet(models.QuerySet):
+    """QuerySet for PomodoroSession with timing annotations."""
+
+    def with_timing(self):
+        """Annotate active elapsed seconds, mirroring ``elapsed_minutes``.
+
+        Lets list endpoints compute timing in one SQL expression rather than
+        calling the property (and ``timezone.now()``) once per row.
+        """
+        current_pause = models.Case(
+            models.When(
+                status="paused",
+                paused_at__isnull=False,
+                then=Now() - models.F("paused_at"),
+            ),
+            default=models.Value(timedelta(0)),
+            output_field=models.DurationField(),
+        )
+        active_duration = models.ExpressionWrapper(
+            Coalesce("completed_at", Now()) - models.F("started_at") - current_pause,
+            output_field=models.DurationField(),
+        )
+        return self.annotate(
+            elapsed_seconds_annotated=Coalesce(
+                Extract(active_duration, "epoch") - models.F("total_paused_seconds"),
+                models.Value(0.0),
+                output_field=models.FloatField(),
+            )
+        )
+
+
+class PomodoroSession(FieldTrackingMixin, models.Model):
     """Individual Pomodoro session records."""
 
     SESSION_TYPES = [
@@ -150,6 +213,9 @@ class PomodoroSession(models.Model):
         ("short_break", "Short Break"),
         ("long_break", "Long Break"),
     ]
+    # Built once; get_session_type_display() rebuilds a dict on every call
+    SESSION_TYPE_LABELS = dict(SESSION_TYPES)
+    BREAK_SESSION_TYPES = frozenset({"short_break", "long_break"})
 
     STATUS_CHOICES = [
         ("active", "Active"),
@@ -218,6 +284,8 @@ class PomodoroSession(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = PomodoroSessionQuerySet.as_manager()
+
     class Meta:
         ordering = ["-started_at"]
         indexes = [
@@ -240,8 +308,8 @@ class PomodoroSession(models.Model):
         """Validate and sanitize session data."""
         super().clean()
 
-        # Sanitize notes
-        if self.notes:
+        # Sanitize notes, unless they are the already-sanitized stored value
+        if self.notes and self.field_changed("notes"):
             self.notes = sanitize_text_input(self.notes)
             validate_text_length(self.notes, 1000)
 
@@ -253,7 +321,22 @@ class PomodoroSession(models.Model):
 
     def save(self, *args, **kwargs):
         """Override save to ensure validation and handle status transitions."""
-        self.full_clean()
+        changed = None if self._state.adding else self.changed_fields()
+        if changed is None:
+            self.full_clean()
+        else:
+            # Timer updates touch a few columns; validate just those rather
+            # than every field (and each foreign key's existence), and write
+            # only what changed. The model has no unique fields to re-check.
+            changed_names = {field.name for field in changed}
+            self.clean_fields(
+                exclude=[
+                    field.name
+                    for field in self._meta.concrete_fields
+                    if field.name not in changed_names
+                ]
+            )
+            self.clean()
 
         # Set completed_at when status changes to completed
         if self.status == "completed" and not self.completed_at:
@@ -277,10 +360,24 @@ class PomodoroSession(models.Model):
                     1, int(duration_seconds / 60)
                 )  # Convert to minutes
 
+        if (
+            changed is not None
+            and "update_fields" not in kwargs
+            and not kwargs.get("force_insert")
+        ):
+            # clean() and the completion logic above may have set more fields
+            kwargs["update_fields"] = [
+                field.name for field in self.changed_fields()
+            ] + ["updated_at"]
+
         super().save(*args, **kwargs)
+        self.snapshot_field_values()
 
     def __str__(self):
-        return f"{self.user.username} - {self.get_session_type_display()} ({self.started_at.strftime('%Y-%m-%d %H:%M')})"
+        session_type = self.SESSION_TYPE_LABELS.get(
+            self.session_type, self.session_type
+        )
+        return f"{self.user.username} - {session_type} ({self.started_at.strftime('%Y-%m-%d %H:%M')})"
 
     @property
     def is_work_session(self):
@@ -290,15 +387,19 @@ class PomodoroSession(models.Model):
     @property
     def is_break_session(self):
         """Check if this is any type of break session."""
-        return self.session_type in ["short_break", "long_break"]
+        return self.session_type in self.BREAK_SESSION_TYPES
 
     @property
     def elapsed_minutes(self):
         """Get elapsed time in minutes since session started (excluding paused time)."""
+        return self.elapsed_minutes_at(timezone.now())
+
+    def elapsed_minutes_at(self, now):
+        """Get elapsed minutes as of `now`, so callers can share one timestamp."""
         if not self.started_at:
             return 0
 
-        end_time = self.completed_at or timezone.now()
+        end_time = self.completed_at or now
         elapsed_seconds = (end_time - self.started_at).total_seconds()
 
         # Subtract total paused time accumulated so far
@@ -306,7 +407,7 @@ class PomodoroSession(models.Model):
 
         # If currently paused, subtract time since pause started
         if self.paused_at and self.status == "paused":
-            current_pause_seconds = (timezone.now() - self.paused_at).total_seconds()
+            current_pause_seconds = (now - self.paused_at).total_seconds()
             elapsed_seconds -= current_pause_seconds
 
         return max(0, int(elapsed_seconds / 60))
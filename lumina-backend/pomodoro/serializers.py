@@ -1,9 +1,29 @@
 """Serializers for Pomodoro timer models."""
 
+from types import MappingProxyType
+
+from django.db import IntegrityError, transaction
 from django.utils import timezone
 from rest_framework import serializers
 
-from .models import PomodoroPreset, PomodoroSession, PomodoroSettings
+from .models import (
+    PRESET_NAME_CONSTRAINT,
+    PomodoroPreset,
+    PomodoroSession,
+    PomodoroSettings,
+    get_violated_constraint,
+)
+
+# Completed, skipped and cancelled sessions cannot be changed
+_TERMINAL_STATUSES = frozenset({"completed", "skipped", "cancelled"})
+
+# Statuses each open session may move to
+_VALID_TRANSITIONS = MappingProxyType(
+    {
+        "active": frozenset({"paused", "completed", "skipped", "cancelled"}),
+        "paused": frozenset({"active", "completed", "skipped", "cancelled"}),
+    }
+)
 
 
 class PomodoroSettingsSerializer(serializers.ModelSerializer):
@@ -84,31 +104,39 @@ class PomodoroPresetSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("Preset name cannot be empty.")
         return value.strip()
 
-    def validate(self, attrs):
-        """Validate the entire preset."""
-        # Check for duplicate names for the same user
-        user = self.context["request"].user
-        name = attrs.get("name")
-
-        if name:
-            existing_preset = PomodoroPreset.objects.filter(user=user, name=name)
-            if self.instance:
-                existing_preset = existing_preset.exclude(pk=self.instance.pk)
-
-            if existing_preset.exists():
-                raise serializers.ValidationError(
-                    {"name": "A preset with this name already exists."}
-                )
+    def create(self, validated_data):
+        """Create the preset, reporting duplicate names as a field error."""
+        # The (user, name) unique constraint is the duplicate check, so a
+        # separate lookup before every write isn't needed
+        try:
+            with transaction.atomic():
+                return super().create(validated_data)
+        except IntegrityError as exc:
+            if get_violated_constraint(exc) != PRESET_NAME_CONSTRAINT:
+                raise
+            raise serializers.ValidationError(
+                {"name": "A preset with this name already exists."}
+            ) from None
 
-        return attrs
+    def update(self, instance, validated_data):
+        """Update the preset, reporting duplicate names as a field error."""
+        try:
+            with transaction.atomic():
+                return super().update(instance, validated_data)
+        except IntegrityError as exc:
+            if get_violated_constraint(exc) != PRESET_NAME_CONSTRAINT:
+                raise
+            raise serializers.ValidationError(
+                {"name": "A preset with this name already exists."}
+            ) from None
 
 
 class PomodoroSessionSerializer(serializers.ModelSerializer):
     """Serializer for PomodoroSession model."""
 
     task_title = serializers.CharField(source="task.title", read_only=True)
-    elapsed_minutes = serializers.IntegerField(read_only=True)
-    remaining_minutes = serializers.IntegerField(read_only=True)
+    elapsed_minutes = serializers.SerializerMethodField()
+    remaining_minutes = serializers.SerializerMethodField()
 
     class Meta:
         model = PomodoroSession
@@ -146,6 +174,23 @@ class PomodoroSessionSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("Task must belong to the current user.")
         return value
 
+    def get_elapsed_minutes(self, obj):
+        """Use the ``with_timing()`` annotation when present."""
+        elapsed_seconds = getattr(obj, "elapsed_seconds_annotated", None)
+        if elapsed_seconds is None:
+            return obj.elapsed_minutes_at(self._now())
+        return max(0, int(elapsed_seconds / 60))
+
+    def _now(self):
+        """Return one timestamp shared by every session in this serialization."""
+        if "now" not in self.context:
+            self.context["now"] = timezone.now()
+        return self.context["now"]
+
+    def get_remaining_minutes(self, obj):
+        """Derive remaining time from the elapsed minutes."""
+        return max(0, obj.planned_duration - self.get_elapsed_minutes(obj))
+
     def validate_productivity_rating(self, value):
         """Validate productivity rating is only set for work sessions."""
         if value is not None:
@@ -161,21 +206,12 @@ class PomodoroSessionSerializer(serializers.ModelSerializer):
         if self.instance:
             current_status = self.instance.status
 
-            # Define valid transitions
-            valid_transitions = {
-                "active": ["paused", "completed", "skipped", "cancelled"],
-                "paused": ["active", "completed", "skipped", "cancelled"],
-                "completed": [],  # Completed sessions cannot be changed
-                "skipped": [],  # Skipped sessions cannot be changed
-                "cancelled": [],  # Cancelled sessions cannot be changed
-            }
-
-            if current_status in ["completed", "skipped", "cancelled"]:
+            if current_status in _TERMINAL_STATUSES:
                 raise serializers.ValidationError(
                     f"Cannot change status of a {current_status} session."
                 )
 
-            if value not in valid_transitions.get(current_status, []):
+            if value not in _VALID_TRANSITIONS.get(current_status, ()):
                 raise serializers.ValidationError(
                     f"Invalid status transition from {current_status} to {value}."
                 )
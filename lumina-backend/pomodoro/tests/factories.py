@@ -68,6 +68,20 @@ class PomodoroSessionFactory(factory.django.DjangoModelFactory):
     productivity_rating = None
     notes = ""
 
+    @classmethod
+    def create_batch_fast(cls, size, **kwargs):
+        """Create `size` sessions in a single INSERT.
+
+        Unlike create_batch, save() isn't called, so full_clean() doesn't run.
+        Related rows aren't created per session: `user` is shared (one is
+        created if not given) and `task` defaults to None.
+        """
+        kwargs.setdefault("task", None)
+        if "user" not in kwargs:
+            kwargs["user"] = UserFactory()
+        sessions = cls.build_batch(size, **kwargs)
+        return PomodoroSession.objects.bulk_create(sessions)
+
 
 class CompletedPomodoroSessionFactory(PomodoroSessionFactory):
     """Factory for completed Pomodoro sessions."""
@@ -1,12 +1,14 @@
 """Tests for Pomodoro models."""
 
 from datetime import timedelta
+from unittest import mock
 
 from django.core.exceptions import ValidationError
 from django.db import IntegrityError
 from django.test import TestCase
 from django.utils import timezone
 
+from api.task.models import sanitize_text_input
 from api.task.tests.factories import TaskFactory
 from api.user.tests.factories import UserFactory
 from pomodoro.models import PomodoroPreset, PomodoroSession
@@ -156,10 +158,41 @@ class PomodoroPresetModelTest(TestCase):
         preset1 = PomodoroPresetFactory(user=self.user, is_default=True)
         preset2 = PomodoroPresetFactory(user=self.user, is_default=True)
 
-        # Should be able to have multiple default presets as it's enforced at the application level
-        self.assertTrue(preset1.is_default)
+        # Saving a new default unsets the previous one
+        preset1.refresh_from_db()
+        self.assertFalse(preset1.is_default)
         self.assertTrue(preset2.is_default)
 
+        # The database rejects a second default written around save()
+        with self.assertRaises(IntegrityError):
+            PomodoroPreset.objects.filter(pk=preset1.pk).update(is_default=True)
+
+    def test_resaving_default_preset_skips_unsetting_others(self):
+        """Test saving an unchanged default preset doesn't update other presets."""
+        preset = PomodoroPresetFactory(user=self.user, is_default=True)
+        preset = PomodoroPreset.objects.get(pk=preset.pk)
+        preset.work_duration = 30
+
+        # User check from full_clean, then the preset UPDATE
+        with self.assertNumQueries(2):
+            preset.save()
+
+    def test_resaving_preset_skips_sanitizing_unchanged_name(self):
+        """Test only a changed preset name is sanitized again on save."""
+        preset = PomodoroPreset.objects.get(pk=self.preset.pk)
+
+        with mock.patch(
+            "pomodoro.models.sanitize_text_input", wraps=sanitize_text_input
+        ) as sanitize:
+            preset.work_duration = 30
+            preset.save()
+            sanitize.assert_not_called()
+
+            preset.name = "<b>Deep Work</b>"
+            preset.save()
+            sanitize.assert_called_once_with("<b>Deep Work</b>")
+        self.assertEqual(preset.name, "Deep Work")
+
     def test_duration_validation_constraints(self):
         """Test duration validation constraints."""
         # Work duration: 1-120
@@ -270,6 +303,21 @@ class PomodoroSessionModelTest(TestCase):
         self.assertGreaterEqual(remaining, 14)
         self.assertLessEqual(remaining, 16)
 
+    def test_with_timing_matches_elapsed_minutes(self):
+        """Test the SQL timing annotation excludes paused time."""
+        now = timezone.now()
+        session = PausedPomodoroSessionFactory(total_paused_seconds=120)
+        session.started_at = now - timedelta(minutes=15)
+        session.paused_at = now - timedelta(minutes=5)
+        session.save()
+
+        annotated = PomodoroSession.objects.with_timing().get(pk=session.pk)
+
+        # 15 minutes since start, minus the current and earlier pauses
+        elapsed_minutes = int(annotated.elapsed_seconds_annotated / 60)
+        self.assertGreaterEqual(elapsed_minutes, 7)
+        self.assertLessEqual(elapsed_minutes, 8)
+
     def test_completed_session_remaining_minutes(self):
         """Test remaining minutes for completed session."""
         now = timezone.now()
@@ -342,6 +390,29 @@ class PomodoroSessionModelTest(TestCase):
         self.session.productivity_rating = 3
         self.session.full_clean()  # Should not raise
 
+    def test_update_validates_only_changed_fields(self):
+        """Test saving a loaded session checks and writes only changed fields."""
+        session = PomodoroSession.objects.get(pk=self.session.pk)
+        session.status = "paused"
+        session.paused_at = timezone.now()
+
+        # No user/task existence checks, just the narrowed UPDATE
+        with self.assertNumQueries(1) as ctx:
+            session.save()
+        update_sql = ctx.captured_queries[0]["sql"]
+        self.assertIn('"paused_at"', update_sql)
+        self.assertNotIn('"planned_duration"', update_sql)
+
+        session.refresh_from_db()
+        self.assertEqual(session.status, "paused")
+
+    def test_update_rejects_invalid_changed_field(self):
+        """Test changed fields are still validated when saving a loaded session."""
+        session = PomodoroSession.objects.get(pk=self.session.pk)
+        session.planned_duration = 0
+        with self.assertRaises(ValidationError):
+            session.save()
+
     def test_session_without_task(self):
         """Test session can be created without a task."""
         session = PomodoroSessionFactory(task=None)
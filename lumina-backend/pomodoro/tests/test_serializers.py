@@ -1,9 +1,15 @@
 """Tests for Pomodoro serializers."""
 
+from datetime import timedelta
+from unittest import mock
+
+from django.db import IntegrityError
 from django.test import TestCase
+from rest_framework.exceptions import ValidationError
 
 from api.task.tests.factories import TaskFactory
 from api.user.tests.factories import UserFactory
+from pomodoro.models import PomodoroPreset
 from pomodoro.serializers import (
     PomodoroPresetSerializer,
     PomodoroSessionCreateSerializer,
@@ -196,6 +202,42 @@ class PomodoroPresetSerializerTest(TestCase):
         self.assertTrue(preset.is_default)
         self.assertEqual(preset.user, self.user)
 
+    def test_create_duplicate_name(self):
+        """Test a duplicate name is reported as a name error."""
+        data = {
+            "name": self.preset.name,
+            "work_duration": 25,
+            "short_break_duration": 5,
+            "long_break_duration": 15,
+            "sessions_until_long_break": 4,
+        }
+
+        serializer = PomodoroPresetSerializer(data=data, context=self.get_context())
+        self.assertTrue(serializer.is_valid())
+        with self.assertRaises(ValidationError) as cm:
+            serializer.save(user=self.user)
+        self.assertIn("name", cm.exception.detail)
+
+    def test_create_reraises_other_integrity_errors(self):
+        """Test integrity errors other than a duplicate name aren't masked."""
+        data = {
+            "name": "Deep Work",
+            "work_duration": 25,
+            "short_break_duration": 5,
+            "long_break_duration": 15,
+            "sessions_until_long_break": 4,
+        }
+
+        serializer = PomodoroPresetSerializer(data=data, context=self.get_context())
+        self.assertTrue(serializer.is_valid())
+        with (
+            mock.patch.object(
+                PomodoroPreset, "save", side_effect=IntegrityError("other")
+            ),
+            self.assertRaises(IntegrityError),
+        ):
+            serializer.save(user=self.user)
+
     def test_validation_name_required(self):
         """Test that name is required."""
         data = {
@@ -286,6 +328,15 @@ class PomodoroSessionSerializerTest(TestCase):
         self.assertIsNotNone(data["started_at"])
         self.assertIn("task", data)
 
+    def test_serialization_uses_shared_now(self):
+        """Test timing fields are computed against the context's timestamp."""
+        now = self.session.started_at + timedelta(minutes=10)
+        serializer = PomodoroSessionSerializer(self.session, context={"now": now})
+        data = serializer.data
+
+        self.assertEqual(data["elapsed_minutes"], 10)
+        self.assertEqual(data["remaining_minutes"], self.session.planned_duration - 10)
+
     def test_serialization_with_task_details(self):
         """Test serializing session with task details."""
         serializer = PomodoroSessionSerializer(self.session)
@@ -1,6 +1,7 @@
 """Tests for Pomodoro views."""
 
 from datetime import timedelta
+from unittest import mock
 
 from django.test import TestCase
 from django.urls import reverse
@@ -14,6 +15,7 @@ from pomodoro.models import PomodoroPreset, PomodoroSession, PomodoroSettings
 
 from .factories import (
     CompletedPomodoroSessionFactory,
+    PausedPomodoroSessionFactory,
     PomodoroPresetFactory,
     PomodoroSessionFactory,
     PomodoroSettingsFactory,
@@ -192,6 +194,25 @@ class PomodoroPresetViewSetTest(TestCase):
         self.assertEqual(preset.short_break_duration, 15)
         self.assertTrue(preset.is_default)
 
+    def test_create_preset_duplicate_name(self):
+        """Test creating a preset with a name the user already has."""
+        PomodoroPresetFactory(user=self.user, name="Deep Work")
+        data = {
+            "name": "Deep Work",
+            "work_duration": 45,
+            "short_break_duration": 15,
+            "long_break_duration": 30,
+            "sessions_until_long_break": 2,
+        }
+
+        response = self.client.post(self.presets_url, data)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("name", response.data)
+        self.assertEqual(
+            PomodoroPreset.objects.filter(user=self.user, name="Deep Work").count(), 1
+        )
+
     def test_update_preset(self):
         """Test updating a preset."""
         preset = PomodoroPresetFactory(user=self.user, name="Original")
@@ -233,6 +254,32 @@ class PomodoroPresetViewSetTest(TestCase):
         self.assertFalse(preset1.is_default)
         self.assertTrue(preset2.is_default)
 
+    def test_set_preset_as_default_conflict(self):
+        """Test losing a race to set the default returns a conflict."""
+        preset1 = PomodoroPresetFactory(user=self.user, is_default=True)
+        preset2 = PomodoroPresetFactory(user=self.user, is_default=False)
+
+        # Hide preset1's default from the query in PomodoroPreset.save() that
+        # unsets other defaults, as a concurrent uncommitted request would
+        filter_presets = PomodoroPreset.objects.filter
+
+        def hide_other_defaults(*args, **kwargs):
+            if kwargs.get("is_default") is True:
+                return PomodoroPreset.objects.none()
+            return filter_presets(*args, **kwargs)
+
+        with mock.patch.object(
+            PomodoroPreset.objects, "filter", side_effect=hide_other_defaults
+        ) as filter_mock:
+            response = self.client.post(f"{self.presets_url}{preset2.id}/set_default/")
+
+        filter_mock.assert_any_call(user_id=self.user.id, is_default=True)
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        preset1.refresh_from_db()
+        preset2.refresh_from_db()
+        self.assertTrue(preset1.is_default)
+        self.assertFalse(preset2.is_default)
+
     def test_apply_preset_to_settings(self):
         """Test applying preset to user's settings."""
         preset = PomodoroPresetFactory(
@@ -277,6 +324,16 @@ class PomodoroSessionViewSetTest(TestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data["results"]), 2)
 
+    def test_list_sessions_query_count(self):
+        """Test listing sessions doesn't query per session."""
+        CompletedPomodoroSessionFactory.create_batch_fast(20, user=self.user)
+
+        with self.assertNumQueries(2):
+            response = self.client.get(self.sessions_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 20)
+
     def test_create_session(self):
         """Test creating a new session."""
         data = {
@@ -342,6 +399,21 @@ class PomodoroSessionViewSetTest(TestCase):
         self.assertEqual(session.status, "paused")
         self.assertIsNotNone(session.paused_at)
 
+    def test_pause_session_returns_timing(self):
+        """Test the pause response reports timing as of the pause."""
+        session = PomodoroSessionFactory(
+            user=self.user, status="active", planned_duration=25
+        )
+        PomodoroSession.objects.filter(pk=session.pk).update(
+            started_at=timezone.now() - timedelta(minutes=10, seconds=30)
+        )
+
+        response = self.client.post(f"{self.sessions_url}{session.id}/pause/")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["elapsed_minutes"], 10)
+        self.assertEqual(response.data["remaining_minutes"], 15)
+
     def test_pause_non_active_session_fails(self):
         """Test that pausing a non-active session fails."""
         session = CompletedPomodoroSessionFactory(user=self.user)
@@ -405,6 +477,25 @@ class PomodoroSessionViewSetTest(TestCase):
         self.assertEqual(session.status, "skipped")
         self.assertIsNotNone(session.completed_at)
 
+    def test_skip_session_returns_timing_as_saved(self):
+        """Test the skip response reports timing for the saved session."""
+        session = PausedPomodoroSessionFactory(user=self.user, planned_duration=25)
+        now = timezone.now()
+        PomodoroSession.objects.filter(pk=session.pk).update(
+            started_at=now - timedelta(minutes=20),
+            paused_at=now - timedelta(minutes=10),
+        )
+
+        response = self.client.post(f"{self.sessions_url}{session.id}/skip/")
+        detail = self.client.get(f"{self.sessions_url}{session.id}/")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["elapsed_minutes"], 20)
+        self.assertEqual(response.data["remaining_minutes"], 5)
+        self.assertEqual(
+            detail.data["elapsed_minutes"], response.data["elapsed_minutes"]
+        )
+
     def test_get_session_stats(self):
         """Test getting session statistics."""
         # Create various types of sessions
@@ -435,6 +526,47 @@ class PomodoroSessionViewSetTest(TestCase):
         self.assertEqual(stats["work_sessions"], 2)
         self.assertEqual(stats["break_sessions"], 1)
 
+    def test_session_stats_daily_breakdown(self):
+        """Test daily and productivity breakdowns in session statistics."""
+        # Start no earlier than midnight, so both sessions fall on today
+        now = timezone.now()
+        started_at = max(
+            now - timedelta(minutes=25),
+            now.replace(hour=0, minute=0, second=0, microsecond=0),
+        )
+        CompletedPomodoroSessionFactory(
+            user=self.user,
+            session_type="work",
+            actual_duration=25,
+            productivity_rating=4,
+            started_at=started_at,
+            completed_at=now,
+        )
+        CompletedPomodoroSessionFactory(
+            user=self.user,
+            session_type="short_break",
+            actual_duration=5,
+            started_at=started_at,
+            completed_at=now,
+        )
+
+        response = self.client.get(f"{self.sessions_url}stats/", {"days": 7})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        today = now.date().isoformat()
+        stats = response.data
+        self.assertEqual(len(stats["sessions_by_day"]), 7)
+        self.assertEqual(stats["sessions_by_day"][today], 2)
+        self.assertEqual(stats["focus_time_by_day"][today], 25)
+        self.assertEqual(stats["total_focus_time"], 25)
+        self.assertEqual(stats["average_productivity"], 4.0)
+        self.assertEqual(
+            stats["productivity_distribution"],
+            {"1": 0, "2": 0, "3": 0, "4": 1, "5": 0},
+        )
+        self.assertEqual(stats["current_streak"], 1)
+        self.assertEqual(stats["longest_streak"], 1)
+
     def test_filter_sessions_by_type(self):
         """Test filtering sessions by type."""
         work_session = PomodoroSessionFactory(user=self.user, session_type="work")
@@ -583,10 +715,7 @@ class PomodoroSessionViewSetTest(TestCase):
         """Test that PATCH with only some fields works without requiring all fields."""
         session = PomodoroSessionFactory(user=self.user, status="active")
 
-        data = {
-            "status": "completed",
-            "notes": "Great work session!"
-        }
+        data = {"status": "completed", "notes": "Great work session!"}
 
         response = self.client.patch(f"{self.sessions_url}{session.id}/", data)
 
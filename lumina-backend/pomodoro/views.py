@@ -3,14 +3,22 @@
 import logging
 from datetime import datetime, timedelta
 
-from django.db.models import Avg, Sum
+from django.db import IntegrityError
+from django.db.models import Avg, Count, Q, Sum
+from django.db.models.functions import TruncDate
 from django.utils import timezone
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
-from .models import PomodoroPreset, PomodoroSession, PomodoroSettings
+from .models import (
+    DEFAULT_PRESET_CONSTRAINT,
+    PomodoroPreset,
+    PomodoroSession,
+    PomodoroSettings,
+    get_violated_constraint,
+)
 from .serializers import (
     PomodoroPresetSerializer,
     PomodoroSessionCreateSerializer,
@@ -123,14 +131,18 @@ class PomodoroPresetViewSet(viewsets.ModelViewSet):
         """Set this preset as the default for the user."""
         preset = self.get_object()
 
-        # Unset other defaults
-        PomodoroPreset.objects.filter(user=request.user, is_default=True).update(
-            is_default=False
-        )
-
-        # Set this one as default
+        # Saving as default unsets the user's other defaults. A concurrent
+        # request making another preset the default can still win the race.
         preset.is_default = True
-        preset.save()
+        try:
+            preset.save()
+        except IntegrityError as exc:
+            if get_violated_constraint(exc) != DEFAULT_PRESET_CONSTRAINT:
+                raise
+            return Response(
+                {"error": "Another preset was made the default at the same time"},
+                status=status.HTTP_409_CONFLICT,
+            )
 
         serializer = self.get_serializer(preset)
         return Response(serializer.data)
@@ -189,7 +201,18 @@ class PomodoroSessionViewSet(viewsets.ModelViewSet):
             except ValueError:
                 pass
 
-        return queryset.select_related("task")
+        queryset = queryset.select_related("task")
+        # Only the list is annotated: other actions change the session before
+        # serializing it, which would leave the annotated timing stale
+        if self.action == "list":
+            queryset = queryset.with_timing()
+        return queryset
+
+    def get_serializer_context(self):
+        """Add one timestamp for timing every session serialized in the request."""
+        context = super().get_serializer_context()
+        context["now"] = timezone.now()
+        return context
 
     def get_serializer_class(self):
         """Return appropriate serializer based on action."""
@@ -381,8 +404,10 @@ class PomodoroSessionViewSet(viewsets.ModelViewSet):
         if time_diff > TIME_SYNC_THRESHOLD_SECONDS:
             logger = logging.getLogger(__name__)
             logger.warning(
-                f"Timer sync discrepancy detected: User {session.user.id}, "
-                f"Session {session_id}, Diff: {time_diff}s"
+                "Timer sync discrepancy detected: User %s, Session %s, Diff: %ss",
+                session.user_id,
+                session_id,
+                time_diff,
             )
 
         return Response(response_data)
@@ -397,29 +422,27 @@ class PomodoroSessionViewSet(viewsets.ModelViewSet):
         start_date = timezone.now().date() - timedelta(days=days)
         queryset = queryset.filter(started_at__date__gte=start_date)
 
-        # Basic counts
-        total_sessions = queryset.count()
-        completed_sessions = queryset.filter(status="completed").count()
-        work_sessions = queryset.filter(session_type="work").count()
-        break_sessions = queryset.filter(
-            session_type__in=["short_break", "long_break"]
-        ).count()
-
-        # Focus time calculation (only completed work sessions)
-        focus_time = (
-            queryset.filter(
-                session_type="work", status="completed", actual_duration__isnull=False
-            ).aggregate(total=Sum("actual_duration"))["total"]
-            or 0
-        )
-
-        # Average session duration
-        avg_duration = (
-            queryset.filter(
-                status="completed", actual_duration__isnull=False
-            ).aggregate(avg=Avg("actual_duration"))["avg"]
-            or 0
+        # Counts, focus time and averages in a single aggregate query
+        completed_work = Q(session_type="work", status="completed")
+        totals = queryset.aggregate(
+            total_sessions=Count("id"),
+            completed_sessions=Count("id", filter=Q(status="completed")),
+            work_sessions=Count("id", filter=Q(session_type="work")),
+            break_sessions=Count(
+                "id", filter=Q(session_type__in=["short_break", "long_break"])
+            ),
+            # Only completed work sessions count as focus time
+            focus_time=Sum("actual_duration", filter=completed_work),
+            avg_duration=Avg("actual_duration", filter=Q(status="completed")),
+            avg_productivity=Avg("productivity_rating", filter=completed_work),
         )
+        total_sessions = totals["total_sessions"]
+        completed_sessions = totals["completed_sessions"]
+        work_sessions = totals["work_sessions"]
+        break_sessions = totals["break_sessions"]
+        focus_time = totals["focus_time"] or 0
+        avg_duration = totals["avg_duration"] or 0
+        avg_productivity = totals["avg_productivity"]
 
         # Completion rate
         completion_rate = (
@@ -430,44 +453,44 @@ class PomodoroSessionViewSet(viewsets.ModelViewSet):
         daily_avg = total_sessions / max(days, 1)
 
         # Streak calculation (consecutive days with completed sessions)
-        current_streak = self._calculate_current_streak(request.user)
-        longest_streak = self._calculate_longest_streak(request.user)
-
-        # Sessions by day
+        completed_dates = self._completed_session_dates(request.user)
+        current_streak = self._calculate_current_streak(completed_dates)
+        longest_streak = self._calculate_longest_streak(completed_dates)
+
+        # Sessions by day, grouped in the database
+        daily_totals = {
+            row["day"]: row
+            for row in queryset.order_by()
+            .values(day=TruncDate("started_at"))
+            .annotate(
+                sessions=Count("id"),
+                focus=Sum("actual_duration", filter=completed_work),
+            )
+        }
         sessions_by_day = {}
         focus_time_by_day = {}
 
+        today = timezone.now().date()
         for i in range(days):
-            date = (timezone.now().date() - timedelta(days=i)).isoformat()
-            day_sessions = queryset.filter(
-                started_at__date=timezone.now().date() - timedelta(days=i)
+            day = today - timedelta(days=i)
+            day_totals = daily_totals.get(day)
+            sessions_by_day[day.isoformat()] = (
+                day_totals["sessions"] if day_totals else 0
             )
-            sessions_by_day[date] = day_sessions.count()
-
-            day_focus = (
-                day_sessions.filter(
-                    session_type="work",
-                    status="completed",
-                    actual_duration__isnull=False,
-                ).aggregate(total=Sum("actual_duration"))["total"]
-                or 0
+            focus_time_by_day[day.isoformat()] = (
+                (day_totals["focus"] or 0) if day_totals else 0
             )
-            focus_time_by_day[date] = day_focus
-
-        # Productivity ratings
-        productivity_stats = queryset.filter(
-            session_type="work", status="completed", productivity_rating__isnull=False
-        ).aggregate(avg=Avg("productivity_rating"))
-
-        avg_productivity = productivity_stats["avg"]
 
         # Productivity distribution
-        productivity_distribution = {}
-        for rating in range(1, 6):
-            count = queryset.filter(
-                session_type="work", productivity_rating=rating
-            ).count()
-            productivity_distribution[str(rating)] = count
+        rating_counts = dict(
+            queryset.filter(session_type="work", productivity_rating__isnull=False)
+            .order_by()
+            .values_list("productivity_rating")
+            .annotate(count=Count("id"))
+        )
+        productivity_distribution = {
+            str(rating): rating_counts.get(rating, 0) for rating in range(1, 6)
+        }
 
         stats_data = {
             "total_sessions": total_sessions,
@@ -491,43 +514,35 @@ class PomodoroSessionViewSet(viewsets.ModelViewSet):
         serializer = PomodoroSessionStatsSerializer(stats_data)
         return Response(serializer.data)
 
-    def _calculate_current_streak(self, user):
+    def _completed_session_dates(self, user):
+        """Return the distinct dates with a completed session, oldest first."""
+        return list(
+            PomodoroSession.objects.filter(user=user, status="completed")
+            .order_by("started_at__date")
+            .values_list("started_at__date", flat=True)
+            .distinct()
+        )
+
+    def _calculate_current_streak(self, completed_dates):
         """Calculate current consecutive days with completed sessions."""
         streak = 0
         current_date = timezone.now().date()
+        completed = set(completed_dates)
 
-        while True:
-            has_completed_session = PomodoroSession.objects.filter(
-                user=user, started_at__date=current_date, status="completed"
-            ).exists()
-
-            if has_completed_session:
-                streak += 1
-                current_date -= timedelta(days=1)
-            else:
-                break
+        while current_date in completed:
+            streak += 1
+            current_date -= timedelta(days=1)
 
         return streak
 
-    def _calculate_longest_streak(self, user):
+    def _calculate_longest_streak(self, dates):
         """Calculate the longest consecutive days streak ever."""
-        # This is a simplified implementation
-        # For better performance, you might want to cache this value
-        sessions = (
-            PomodoroSession.objects.filter(user=user, status="completed")
-            .values("started_at__date")
-            .distinct()
-            .order_by("started_at__date")
-        )
-
-        if not sessions:
+        if not dates:
             return 0
 
         longest_streak = 0
         current_streak = 1
 
-        dates = [session["started_at__date"] for session in sessions]
-
         for i in range(1, len(dates)):
             if (dates[i] - dates[i - 1]).days == 1:
                 current_streak += 1
@@ -472,9 +472,14 @@ class ApiService {
       : API_ENDPOINTS.TASKS.LIST;
 
     const response = await this.request<{
-      count: number;
-      next: string | null;
-      previous: string | null;
+      pagination: {
+        count: number;
+        next: string | null;
+        previous: string | null;
+        current_page: number;
+        total_pages: number;
+        page_size: number;
+      };
       results: TaskListItem[];
     }>(endpoint);
 
@@ -80,6 +80,7 @@ export interface TaskListItem {
   is_overdue: boolean;
   subtask_count: number;
   completed_subtask_count: number;
+  comment_count: number;
   created_at: string;
   updated_at: string;
 }